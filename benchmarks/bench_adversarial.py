@@ -0,0 +1,118 @@
+"""Check that the entity regexes take linear time on crafted worst-case inputs.
+
+Run:
+    python benchmarks/bench_adversarial.py
+    python benchmarks/bench_adversarial.py --sizes-kb 4 64 --max-ms-per-kb 5 -o adversarial.json
+
+Every input is built to make a backtracking regex engine retry long stretches of
+text: runs of word characters, hyphens and ``@`` without a valid email, hosts
+without a TLD, dotted strings, ``http://`` followed by colons, runs of backticks
+and unterminated code fences. Each is timed at several sizes with the step it
+targets and with all entity steps fused into one scan.
+
+The script fails (exit code 1) if a case takes more than ``--max-ms-per-kb``
+milliseconds per KB at any size, or if its time per KB grows by more than
+``--max-growth`` from the smallest to the largest size, i.e., if it is not
+near-linear in the input length.
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from functools import partial
+
+logging.disable(logging.WARNING)
+
+from cleantext import replace_code, replace_emails, replace_urls
+from cleantext.clean import replace_entities
+
+STEPS = ("no_code", "no_urls", "no_emails")
+TOKENS = {"no_code": "<CODE>", "no_urls": "<URL>", "no_emails": "<EMAIL>"}
+
+# name -> (function of the size in characters returning the text, step it targets)
+CASES = {
+    "word run": (lambda n: "a" * n, replace_emails),
+    "hyphenated run": (lambda n: "a-" * (n // 2), replace_emails),
+    "plus run": (lambda n: "a+" * (n // 2), replace_emails),
+    "at signs": (lambda n: ("a" * 10 + "@") * (n // 11), replace_emails),
+    "host without tld": (lambda n: "x@" + "a" * n, replace_emails),
+    "hyphenated host": (lambda n: "x@" + "a-" * (n // 2), replace_emails),
+    "dotted string": (lambda n: "a." * (n // 2), replace_emails),
+    "colon hosts": (lambda n: ":a@b-" * (n // 5), replace_emails),
+    "url word run": (lambda n: "http://" + "a" * n, replace_urls),
+    "url colons": (lambda n: "http://" + "a:" * (n // 2), replace_urls),
+    "url protocols": (lambda n: "http://" * (n // 7), replace_urls),
+    "url dotted host": (lambda n: "www." + "a." * (n // 2), replace_urls),
+    "www hyphens": (lambda n: "-www.a" * (n // 6), replace_urls),
+    "www hyphens before tld": (lambda n: ("-www.a" * 40 + "--.cc ") * (n // 247), replace_urls),
+    "backticks": (lambda n: "`" * n, replace_code),
+    "backtick words": (lambda n: "`a" * (n // 2), replace_code),
+    "unterminated fence": (lambda n: "```\n" + "a" * n, replace_code),
+    "unterminated fences": (lambda n: ("`" * 70 + "\n" + "a" * 100) * (n // 171), replace_code),
+}
+
+
+def best_time(func, text, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def run(args):
+    fused = partial(replace_entities, steps=STEPS, tokens=TOKENS)
+    results = {}
+    failures = []
+    print(f"{'case':22s} {'step':8s} " + " ".join(f"{f'{size} KB':>10s}" for size in args.sizes_kb) + "  growth")
+    for name, (make, step) in CASES.items():
+        for label, func in (("single", step), ("fused", fused)):
+            ms_per_kb = []
+            for size in args.sizes_kb:
+                text = make(size * 1000)
+                ms_per_kb.append(best_time(func, text, args.repeat) * 1e3 / (len(text) / 1000))
+            growth = ms_per_kb[-1] / max(ms_per_kb[0], 1e-6)
+            results[f"{name}/{label}"] = {"ms_per_kb": dict(zip(args.sizes_kb, ms_per_kb)), "growth": growth}
+            slow = max(ms_per_kb) > args.max_ms_per_kb or growth > args.max_growth
+            if slow:
+                failures.append(f"{name}/{label}")
+            print(
+                f"{name:22s} {label:8s} "
+                + " ".join(f"{t:7.3f} ms" for t in ms_per_kb)
+                + f"  {growth:5.2f}x"
+                + ("  FAIL" if slow else "")
+            )
+    return results, failures
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes-kb", type=int, nargs="+", default=[1, 8, 64], help="input sizes (default: 1 8 64)")
+    parser.add_argument("--repeat", type=int, default=3, help="timing runs per case and size (default: 3)")
+    parser.add_argument("--max-ms-per-kb", type=float, default=20, help="time limit per KB (default: 20)")
+    parser.add_argument(
+        "--max-growth", type=float, default=3, help="limit of the growth of the time per KB (default: 3)"
+    )
+    parser.add_argument("-o", "--output", help="write the results as JSON to this file")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.sizes_kb = sorted(args.sizes_kb)
+    results, failures = run(args)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"sizes_kb": args.sizes_kb, "results": results, "failures": failures}, f, indent=2)
+    if failures:
+        print(f"\n{len(failures)} cases are too slow: {', '.join(failures)}")
+        return 1
+    print(f"\nAll {len(results)} cases are below {args.max_ms_per_kb} ms per KB and grow at most {args.max_growth}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
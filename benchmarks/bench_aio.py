@@ -0,0 +1,66 @@
+"""Benchmark event-loop latency while cleaning large posts.
+
+Run:
+    python benchmarks/bench_aio.py
+
+A ticker coroutine measures how late the event loop wakes it up while a batch
+of large posts is cleaned, either inline with ``clean()`` or offloaded with
+``aclean_texts()``.
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+logging.disable(logging.WARNING)
+
+from cleantext import clean
+from cleantext.aio import aclean_texts
+
+POSTS = ["Grüße aus München! Visit https://example.com or call 555-123-4567. " * 200] * 40
+OPTIONS = {"no_urls": True, "no_phone_numbers": True}
+
+
+async def ticker(lags, stop, interval=0.005):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+
+
+async def measure(label, work):
+    lags = []
+    stop = asyncio.Event()
+    tick = asyncio.ensure_future(ticker(lags, stop))
+    await asyncio.sleep(0.02)
+    start = time.perf_counter()
+    await work()
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await tick
+    lags.sort()
+    print(
+        f"  {label:34s} {elapsed:6.2f}s  loop lag p50 {lags[len(lags) // 2] * 1e3:6.1f}ms  max {lags[-1] * 1e3:7.1f}ms"
+    )
+
+
+async def main():
+    print(f"{len(POSTS)} posts of {len(POSTS[0]):,} characters")
+
+    async def inline():
+        for post in POSTS:
+            clean(post, **OPTIONS)
+            await asyncio.sleep(0)
+
+    await measure("clean() inline", inline)
+    await measure("aclean_texts(), threads", lambda: aclean_texts(POSTS, chunksize=1, **OPTIONS))
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        await aclean_texts(POSTS[:2], executor=executor, **OPTIONS)
+        await measure(
+            "aclean_texts(), 2 processes", lambda: aclean_texts(POSTS, executor=executor, chunksize=1, **OPTIONS)
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,231 @@
+"""Measure end-to-end throughput and memory of clean_texts() on a realistic corpus.
+
+Run:
+    python benchmarks/bench_end_to_end.py
+    python benchmarks/bench_end_to_end.py --size-mb 50 --n-jobs 1 2 4 8 --options all -o e2e.json
+
+The corpus comes from ``corpus.py`` (tweets, emails, markdown, multilingual
+news, mojibake scrapes and a few pathological long lines). The script reports:
+
+- texts/s and MB/s of a sequential run per kind of text
+- for every ``n_jobs``: the wall time of a cold ``clean_texts()`` call (which
+  starts its own workers), the start-up time of a ``CleaningPool`` (processes
+  plus a first tiny batch) and its steady-state time per batch, the scaling
+  relative to ``n_jobs=1``, the peak RSS of the parent and of the largest
+  worker, and the ``tracemalloc`` peak of Python allocations in the parent
+
+Each ``n_jobs`` is measured in a fresh subprocess, so the peak RSS values don't
+carry over from one configuration to the next. Peak RSS is not available on
+Windows.
+"""
+
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logging.disable(logging.WARNING)
+
+from corpus import MIX, generate
+
+from cleantext import Cleaner, CleaningPool, clean_texts
+
+OPTIONS = {
+    "default": {},
+    "entities": {
+        "no_urls": True,
+        "no_emails": True,
+        "no_phone_numbers": True,
+        "no_numbers": True,
+        "no_currency_symbols": True,
+    },
+    "all": {
+        "no_line_breaks": True,
+        "no_code": True,
+        "no_urls": True,
+        "no_emails": True,
+        "no_phone_numbers": True,
+        "no_ip_addresses": True,
+        "no_file_paths": True,
+        "no_numbers": True,
+        "no_currency_symbols": True,
+        "no_punct": True,
+        "no_emoji": True,
+    },
+}
+
+
+def peak_rss_mb(who):
+    """Peak resident set size in MB of this process or of its largest waited-for child."""
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF if who == "self" else resource.RUSAGE_CHILDREN)
+    # kilobytes on Linux, bytes on macOS
+    return usage.ru_maxrss / 1e6 if sys.platform == "darwin" else usage.ru_maxrss * 1024 / 1e6
+
+
+def measure(texts, n_jobs, options, repeat):
+    """Measure one ``n_jobs`` configuration, meant to run in a fresh process."""
+    rss_before = peak_rss_mb("self")
+
+    start = time.perf_counter()
+    clean_texts(texts, n_jobs=n_jobs, **options)
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with CleaningPool(n_jobs=n_jobs, **options) as pool:
+        pool.map(texts[: 4 * n_jobs])
+        startup = time.perf_counter() - start
+        steady = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            pool.map(texts)
+            steady.append(time.perf_counter() - start)
+
+    result = {
+        "cold_s": cold,
+        "startup_s": startup,
+        "steady_s": min(steady),
+        "rss_before_mb": rss_before,
+        "rss_parent_mb": peak_rss_mb("self"),
+        "rss_worker_mb": peak_rss_mb("children") if n_jobs > 1 else None,
+    }
+
+    # tracemalloc slows allocations down, so it gets a run of its own
+    tracemalloc.start()
+    clean_texts(texts, n_jobs=n_jobs, **options)
+    result["tracemalloc_peak_mb"] = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+    return result
+
+
+def per_kind(corpus, options):
+    """Sequential throughput per kind of text."""
+    cleaner = Cleaner(**options)
+    by_kind = defaultdict(list)
+    for kind, text in corpus:
+        by_kind[kind].append(text)
+    results = {}
+    for kind, texts in by_kind.items():
+        start = time.perf_counter()
+        cleaner.map(texts)
+        elapsed = time.perf_counter() - start
+        size = sum(len(text.encode("utf-8")) for text in texts)
+        results[kind] = {
+            "texts": len(texts),
+            "mb": size / 1e6,
+            "median_chars": sorted(map(len, texts))[len(texts) // 2],
+            "texts_per_s": len(texts) / elapsed,
+            "mb_per_s": size / 1e6 / elapsed,
+        }
+    return results
+
+
+def run_in_subprocess(corpus_file, n_jobs, args):
+    command = [sys.executable, __file__, "--measure", str(n_jobs), "--corpus-file", corpus_file]
+    command += ["--options", args.options, "--repeat", str(args.repeat)]
+    output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--size-mb", type=float, default=10, help="corpus size (default: 10)")
+    parser.add_argument("--seed", type=int, default=0, help="corpus seed (default: 0)")
+    parser.add_argument("--exclude", nargs="+", choices=MIX, default=[], help="kinds of text to leave out")
+    parser.add_argument(
+        "--n-jobs", type=int, nargs="+", help="worker counts to compare (default: 1, 2 and the number of CPUs)"
+    )
+    parser.add_argument("--options", choices=OPTIONS, default="entities", help="cleaning options (default: entities)")
+    parser.add_argument("--repeat", type=int, default=3, help="steady-state batches per n_jobs (default: 3)")
+    parser.add_argument("-o", "--output", help="write the results as JSON to this file")
+    # internal: measure one configuration and print the result as JSON
+    parser.add_argument("--measure", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--corpus-file", help=argparse.SUPPRESS)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    options = OPTIONS[args.options]
+
+    if args.measure is not None:
+        with open(args.corpus_file, encoding="utf-8") as f:
+            texts = json.load(f)
+        print(json.dumps(measure(texts, args.measure, options, args.repeat)))
+        return
+
+    n_jobs_list = args.n_jobs or sorted({1, 2, os.cpu_count() or 1})
+    start = time.perf_counter()
+    mix = {kind: share for kind, share in MIX.items() if kind not in args.exclude}
+    corpus = generate(size_mb=args.size_mb, seed=args.seed, mix=mix)
+    texts = [text for _, text in corpus]
+    size = sum(len(text.encode("utf-8")) for text in texts) / 1e6
+    print(
+        f"{len(texts):,} texts, {size:.1f} MB (generated in {time.perf_counter() - start:.1f}s), "
+        f"options: {args.options}, {os.cpu_count()} CPUs"
+    )
+
+    kinds = per_kind(corpus, options)
+    print(f"\n{'kind':14s} {'texts':>7s} {'MB':>6s} {'median chars':>13s} {'texts/s':>9s} {'MB/s':>6s}")
+    for kind, r in sorted(kinds.items()):
+        print(
+            f"{kind:14s} {r['texts']:7,d} {r['mb']:6.2f} {r['median_chars']:13,d} "
+            f"{r['texts_per_s']:9,.1f} {r['mb_per_s']:6.2f}"
+        )
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus_file = os.path.join(tmp, "corpus.json")
+        with open(corpus_file, "w", encoding="utf-8") as f:
+            json.dump(texts, f)
+        print(
+            f"\n{'n_jobs':>6s} {'cold':>7s} {'startup':>8s} {'steady':>7s} {'texts/s':>9s} {'MB/s':>6s} "
+            f"{'scaling':>8s} {'RSS parent':>11s} {'RSS worker':>11s} {'tracemalloc':>12s}"
+        )
+        for n_jobs in n_jobs_list:
+            r = run_in_subprocess(corpus_file, n_jobs, args)
+            r["texts_per_s"] = len(texts) / r["steady_s"]
+            r["mb_per_s"] = size / r["steady_s"]
+            r["scaling"] = results[n_jobs_list[0]]["steady_s"] / r["steady_s"] if results else 1.0
+            results[n_jobs] = r
+            worker = f"{r['rss_worker_mb']:8.0f} MB" if r["rss_worker_mb"] is not None else f"{'-':>11s}"
+            parent = f"{r['rss_parent_mb']:8.0f} MB" if r["rss_parent_mb"] is not None else f"{'-':>11s}"
+            print(
+                f"{n_jobs:6d} {r['cold_s']:6.2f}s {r['startup_s']:7.2f}s {r['steady_s']:6.2f}s "
+                f"{r['texts_per_s']:9,.0f} {r['mb_per_s']:6.2f} {r['scaling']:7.2f}x "
+                f"{parent} {worker} {r['tracemalloc_peak_mb']:9.1f} MB"
+            )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "corpus": {
+                        "texts": len(texts),
+                        "mb": size,
+                        "seed": args.seed,
+                        "exclude": args.exclude,
+                        "options": args.options,
+                    },
+                    "per_kind": kinds,
+                    "n_jobs": results,
+                },
+                f,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
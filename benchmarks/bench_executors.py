@@ -0,0 +1,56 @@
+"""Benchmark clean_texts() with process, thread and sub-interpreter workers.
+
+Run:
+    python benchmarks/bench_executors.py
+
+Threads share the compiled cleaner and need no pickling, but they only run in
+parallel on free-threaded builds (e.g. ``python3.13t``). Run this script with
+both a regular and a free-threaded interpreter to compare the scaling.
+"""
+
+import concurrent.futures
+import logging
+import os
+import sys
+import sysconfig
+import time
+
+logging.disable(logging.WARNING)
+
+from cleantext import clean_texts
+
+TEXTS = [
+    "Visit https://example.com or mail me@example.com, call 555-123-4567!",
+    "Grüße aus München — «quotes» and emoji 🎉👍🏽 café",
+    "drive-thru costs $5 at 192.168.0.1 ~/docs/file.txt",
+    "plain ascii text " * 20,
+] * 5_000
+OPTIONS = {"no_urls": True, "no_emails": True, "no_phone_numbers": True, "no_currency_symbols": True}
+
+
+def main():
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(
+        f"Python {sys.version.split()[0]}, free-threaded build: {bool(sysconfig.get_config_var('Py_GIL_DISABLED'))}, "
+        f"GIL enabled: {gil}, {os.cpu_count()} CPUs, {len(TEXTS):,} texts"
+    )
+    executors = ["process", "thread"]
+    if hasattr(concurrent.futures, "InterpreterPoolExecutor"):
+        executors.append("interpreter")
+
+    # compile the regexes and tables first
+    clean_texts(TEXTS[:10], **OPTIONS)
+    start = time.perf_counter()
+    clean_texts(TEXTS, **OPTIONS)
+    baseline = time.perf_counter() - start
+    print(f"  {'n_jobs=1':24s} {baseline:7.3f}s (1.00x)")
+    for executor in executors:
+        for n_jobs in (2, 4, 8):
+            start = time.perf_counter()
+            clean_texts(TEXTS, n_jobs=n_jobs, executor=executor, **OPTIONS)
+            elapsed = time.perf_counter() - start
+            print(f"  {executor + f', n_jobs={n_jobs}':24s} {elapsed:7.3f}s ({baseline / elapsed:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
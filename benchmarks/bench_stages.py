@@ -0,0 +1,283 @@
+"""Benchmark each cleaning step on its own and compare against a stored baseline.
+
+Run:
+    python benchmarks/bench_stages.py -o results.json
+    python benchmarks/bench_stages.py --baseline results.json --threshold 0.2
+
+Every public step of ``cleantext/clean.py`` is timed on short (~200 characters),
+medium (~10 KB) and huge (~1 MB) inputs of ASCII and of multilingual text.
+``to_ascii_unicode`` is timed per ``lang`` and, if ``unidecode`` is installed,
+once more in a subprocess without it (the ``unicodedata`` fallback).
+
+Results are written as JSON (``-o``). With ``--baseline``, the best time per call
+of every case is compared to the baseline's; cases slower by more than
+``--threshold`` (a fraction) are listed and the exit code is 1, so the script can
+gate a CI job. Compare results from the same machine only.
+"""
+
+import argparse
+import importlib.metadata
+import json
+import logging
+import os
+import platform
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+from functools import partial
+
+if "--without-unidecode" in sys.argv:
+    # importing unidecode now raises ImportError, cleantext falls back to unicodedata
+    sys.modules["unidecode"] = None
+
+logging.disable(logging.WARNING)
+
+import cleantext
+from cleantext.clean import (
+    _compile_exceptions,
+    _protect_exceptions,
+    _restore_exceptions,
+    fix_bad_unicode,
+    normalize_whitespace,
+    remove_emoji,
+    remove_punct,
+    replace_code,
+    replace_currency_symbols,
+    replace_digits,
+    replace_emails,
+    replace_file_paths,
+    replace_ip_addresses,
+    replace_numbers,
+    replace_phone_numbers,
+    replace_punct,
+    replace_urls,
+    to_ascii_unicode,
+)
+
+# ── inputs ───────────────────────────────────────────────────────────────────
+
+ASCII_PARTS = [
+    "The quick brown fox jumps over the lazy dog.",
+    "Visit https://example.com/path?q=1&r=2 or http://www.test.org/a-b_c for more info.",
+    "Mail support@example.com or first.last+tag@mail.example.co.uk today!",
+    "Call +1-555-123-4567 or (555) 987 6543, ext. 42.",
+    "It costs $1,299.99 (about 1199.99 EUR) at 192.168.0.1 and 2001:db8::1.",
+    "Edit /etc/nginx/nginx.conf, ./src/main.py or C:\\Users\\Admin\\file.txt carefully.",
+    "Use `pip install clean-text` and then:\n```python\nprint('hello')\n```\n",
+    "Hello,   world!  This is    some text\twith   irregular   spacing...\n\n\n",
+    "I can't. No, I won't! It's a matter of \"principle\"; of -- what's the word? -- conscience.",
+    "drive-thru, e-mail and 3.14 are kept verbatim as exceptions.",
+]
+
+MULTILINGUAL_PARTS = [
+    "Grüße aus München! Die Bäcker in Köln verkaufen Brötchen für 2,50 €.",
+    "¿Dónde está la estación? Mañana vamos a Málaga, señor Núñez.",
+    "Ça coûte 12 € à Besançon — «très cher», dit-elle en août.",
+    "Smörgåsbord på Öland, blåbær i Ærøskøbing og þorramatur á Íslandi.",
+    "Αθήνα και Θεσσαλονίκη είναι πόλεις στην Ελλάδα.",
+    "Москва — столица России, а Киев — столица Украины.",
+    "東京は日本の首都です。北京是中国的首都。",
+    "Emoji: 🎉👍🏽 👩🏾\u200d🎓 🇩🇪 ❤️ and text around them 🤔🙈",
+    "Mojibake: donâ€™t, Ã¼ber, cafÃ© and &lt;b&gt;HTML&lt;/b&gt; entities.",
+    "»Yóù àré     rïght &lt;3!«  \u2018quoted\u2019 \u201cagain\u201d 〞odd〞",
+    "Visit https://example.com/über or mail jürgen@example.de, call +49 30 1234567.",
+]
+
+SIZES = {"short": 200, "medium": 10_000, "huge": 1_000_000}
+
+
+def make_text(parts, size, seed=0):
+    """Shuffle ``parts`` into a text of about ``size`` characters, deterministically."""
+    rng = random.Random(seed)
+    pieces = []
+    length = 0
+    while length < size:
+        piece = rng.choice(parts)
+        pieces.append(piece)
+        length += len(piece) + 1
+    return " ".join(pieces)[:size]
+
+
+def inputs(sizes):
+    return {
+        f"{kind}/{size}": make_text(parts, SIZES[size])
+        for kind, parts in (("ascii", ASCII_PARTS), ("multilingual", MULTILINGUAL_PARTS))
+        for size in sizes
+    }
+
+
+# ── steps ────────────────────────────────────────────────────────────────────
+
+EXCEPTIONS = _compile_exceptions([r"\w+-\w+", r"\d+\.\d+"])
+
+
+def protect_and_restore(text):
+    protected, originals = _protect_exceptions(text, EXCEPTIONS)
+    return _restore_exceptions(protected, originals)
+
+
+def steps(langs, unidecode_label):
+    """Return ``{name: func(text)}`` of the steps to time."""
+    steps = {"fix_bad_unicode": fix_bad_unicode}
+    for lang in langs:
+        steps[f"to_ascii_unicode[lang={lang},{unidecode_label}]"] = partial(to_ascii_unicode, lang=lang)
+    steps.update(
+        {
+            "normalize_whitespace": normalize_whitespace,
+            "normalize_whitespace[no_line_breaks]": partial(normalize_whitespace, no_line_breaks=True),
+            "replace_urls": replace_urls,
+            "replace_emails": replace_emails,
+            "replace_phone_numbers": replace_phone_numbers,
+            "replace_ip_addresses": replace_ip_addresses,
+            "replace_numbers": replace_numbers,
+            "replace_digits": replace_digits,
+            "replace_currency_symbols": replace_currency_symbols,
+            "replace_code": replace_code,
+            "replace_file_paths": replace_file_paths,
+            "replace_punct": replace_punct,
+            "remove_punct": remove_punct,
+            "remove_emoji": remove_emoji,
+            "protect_and_restore_exceptions": protect_and_restore,
+        }
+    )
+    return steps
+
+
+# ── timing ───────────────────────────────────────────────────────────────────
+
+
+def time_call(func, text, min_time, repeat):
+    """Return the best and the median seconds per call of ``func(text)``."""
+    # the first call compiles regexes and fills caches
+    func(text)
+    timer = timeit.Timer(lambda: func(text))
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time / repeat or number >= 1_000_000:
+            break
+        number *= 10
+    times = sorted(t / number for t in [elapsed] + timer.repeat(repeat - 1, number))
+    return times[0], times[len(times) // 2], number
+
+
+def run(args):
+    unidecode_label = "unidecode=off" if args.without_unidecode else "unidecode=on"
+    texts = inputs(args.sizes)
+    results = {}
+    for step, func in steps(args.langs, unidecode_label).items():
+        for text_name, text in texts.items():
+            name = f"{step}/{text_name}"
+            if args.filter and not re.search(args.filter, name):
+                continue
+            best, median, number = time_call(func, text, args.min_time, args.repeat)
+            results[name] = {
+                "best_us": best * 1e6,
+                "median_us": median * 1e6,
+                "mb_per_s": len(text.encode("utf-8")) / best / 1e6,
+                "chars": len(text),
+                "number": number,
+            }
+            if not args.quiet:
+                print(f"  {name:72s} {best * 1e6:12.1f} µs  {len(text.encode('utf-8')) / best / 1e6:8.1f} MB/s")
+    return results
+
+
+def run_without_unidecode(args):
+    """Time ``to_ascii_unicode`` with the fallback in a subprocess that can't import unidecode."""
+    with tempfile.TemporaryDirectory() as tmp:
+        output = os.path.join(tmp, "fallback.json")
+        command = [sys.executable, __file__, "--without-unidecode", "--filter", "^to_ascii_unicode", "-o", output]
+        command += ["--min-time", str(args.min_time), "--repeat", str(args.repeat)]
+        command += ["--sizes", *args.sizes, "--langs", *args.langs]
+        if args.quiet:
+            command.append("--quiet")
+        subprocess.run(command, check=True)
+        with open(output, encoding="utf-8") as f:
+            return json.load(f)["results"]
+
+
+def metadata(args):
+    try:
+        unidecode_version = None if args.without_unidecode else importlib.metadata.version("unidecode")
+    except importlib.metadata.PackageNotFoundError:
+        unidecode_version = None
+    return {
+        "cleantext": cleantext.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "unidecode": unidecode_version,
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "min_time": args.min_time,
+        "repeat": args.repeat,
+    }
+
+
+def compare(results, baseline, threshold):
+    """Print the cases that got slower or faster than ``baseline`` and return the regressions."""
+    regressions = []
+    common = sorted(set(results) & set(baseline))
+    print(f"\nCompared {len(common)} cases to the baseline (threshold {threshold:.0%}):")
+    for name in common:
+        ratio = results[name]["best_us"] / baseline[name]["best_us"]
+        if ratio > 1 + threshold:
+            regressions.append(name)
+            print(f"  SLOWER {name:72s} {ratio:6.2f}x")
+        elif ratio < 1 / (1 + threshold):
+            print(f"  faster {name:72s} {ratio:6.2f}x")
+    missing = len(set(baseline) - set(results))
+    new = len(set(results) - set(baseline))
+    if missing or new:
+        print(f"  ({missing} baseline cases not run, {new} cases not in the baseline)")
+    print(f"{len(regressions)} regressions")
+    return regressions
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-o", "--output", help="write the results as JSON to this file")
+    parser.add_argument("--baseline", help="JSON results of an earlier run to compare with")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="slowdown that counts as regression (default: 0.2)"
+    )
+    parser.add_argument("--filter", help="only run cases whose name matches this regex")
+    parser.add_argument("--sizes", nargs="+", choices=SIZES, default=list(SIZES))
+    parser.add_argument("--langs", nargs="+", default=["en", "de", "es"], help="languages for to_ascii_unicode")
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds to spend per case (default: 0.2)")
+    parser.add_argument("--repeat", type=int, default=5, help="timing runs per case (default: 5)")
+    parser.add_argument("--without-unidecode", action="store_true", help="time the unicodedata fallback only")
+    parser.add_argument("--quiet", action="store_true", help="don't print every case")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    results = run(args)
+    if not args.without_unidecode and (args.filter is None or re.search(args.filter, "to_ascii_unicode")):
+        try:
+            import unidecode  # noqa: F401
+        except ImportError:
+            pass
+        else:
+            results.update(run_without_unidecode(args))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"meta": metadata(args), "results": results}, f, indent=2, sort_keys=True)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+"""Benchmark CleanTransformer.transform on a pandas Series.
+
+Run:
+    python benchmarks/bench_transformer.py
+
+``transform`` used to call ``clean(text, **self.get_params())`` for every row,
+i.e. it introspected the estimator's parameters and looked up the cached
+``Cleaner`` once per row. It now resolves the ``Cleaner`` once per call and
+cleans the column with one batched ``Cleaner.map``.
+"""
+
+import logging
+import time
+
+logging.disable(logging.WARNING)
+
+import pandas as pd
+
+from cleantext import clean
+from cleantext.sklearn import CleanTransformer
+
+TEXTS = [
+    "Visit https://example.com or mail me at someone@example.com!",
+    "Call 555-123-4567 today,  prices from $5.",
+    "Grüße aus München — schöne Zeit!",
+    "short",
+]
+
+
+def per_row(transformer, X):
+    # the previous implementation of `transform` for a Series, without the later `n_jobs`
+    def clean_row(text):
+        params = transformer.get_params()
+        params.pop("n_jobs")
+        return clean(text, **params)
+
+    return X.apply(clean_row)
+
+
+def bench(label, func, X):
+    func(X.head(10))
+    start = time.perf_counter()
+    func(X)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:32s} {elapsed:8.3f}s  ({elapsed / len(X) * 1e6:6.1f} µs/row)")
+    return elapsed
+
+
+def main():
+    for n_rows in (10_000, 100_000):
+        X = pd.Series(TEXTS * (n_rows // len(TEXTS)), name="text")
+        for params in ({}, {"no_urls": True, "no_emails": True, "no_phone_numbers": True, "no_punct": True}):
+            transformer = CleanTransformer(**params)
+            print(f"{n_rows:,} rows, {params or 'defaults'}")
+            before = bench("per row (previous)", lambda X: per_row(transformer, X), X)
+            after = bench("CleanTransformer.transform", transformer.transform, X)
+            print(f"  speedup: {before / after:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
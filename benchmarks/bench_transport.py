@@ -0,0 +1,52 @@
+"""Benchmark how texts get to the worker processes of a CleaningPool and back.
+
+Run:
+    python benchmarks/bench_transport.py
+
+``transport="pickle"`` pickles every text and every result, ``"shared_memory"``
+packs a batch into one UTF-8 buffer plus offsets and each chunk of results
+into another. The cleaning work is the same; with all steps disabled only the
+transport is left.
+"""
+
+import logging
+import os
+import time
+
+logging.disable(logging.WARNING)
+
+from cleantext import CleaningPool
+
+BATCHES = {
+    "100,000 short texts": [f"tweet number {i}, nothing special" for i in range(100_000)],
+    "20,000 texts of 2 KB": [f"some plain ascii words {i} " * 80 for i in range(20_000)],
+    "200 texts of 200 KB": [f"a long document {i} " * 10_000 for i in range(200)],
+}
+# every step disabled: only the transport is measured
+NOTHING = {"fix_unicode": False, "to_ascii": False, "lower": False, "normalize_whitespace": False}
+TYPICAL = {"no_urls": True, "no_emails": True}
+REPEAT = 3
+
+
+def best_of(pool, texts, transport):
+    times = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        pool.map(texts, transport=transport)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    print(f"{os.cpu_count()} CPUs, best of {REPEAT}")
+    for label, options in (("no cleaning", NOTHING), ("no_urls, no_emails", TYPICAL)):
+        print(label)
+        with CleaningPool(n_jobs=2, **options) as pool:
+            for name, texts in BATCHES.items():
+                pickled = best_of(pool, texts, "pickle")
+                shared = best_of(pool, texts, "shared_memory")
+                print(f"  {name:22s} pickle {pickled:6.3f}s  shared_memory {shared:6.3f}s ({pickled / shared:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
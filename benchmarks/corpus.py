@@ -0,0 +1,238 @@
+"""Generate a synthetic, realistic corpus for the benchmarks.
+
+Run:
+    python benchmarks/corpus.py --size-mb 10 -o corpus.jsonl
+
+The corpus mixes the kinds of text clean-text is used on, with skewed lengths
+and few exact duplicates:
+
+- ``tweet``: short posts with mentions, hashtags, URLs, emoji and numbers
+- ``email``: messages with greetings, quoted replies and signatures with
+  phone numbers, email addresses and disclaimers
+- ``markdown``: documents with headings, lists, links, inline code and fences
+- ``news``: multilingual news paragraphs (de, fr, es, sv, el, ru, zh)
+- ``scrape``: web scrapes with mojibake, HTML entities and odd whitespace
+- ``pathological``: very long lines without spaces, with runs of dots,
+  ``@``, backticks and digits
+
+Each line of the output is a JSON object ``{"kind": ..., "text": ...}``, so it
+can be piped through ``cleantext --field text``. Import :func:`generate` to use
+the corpus in a benchmark directly. The same seed always yields the same corpus.
+"""
+
+import argparse
+import json
+import random
+import string
+import sys
+
+# share of the texts of each kind
+MIX = {"tweet": 0.5, "email": 0.14, "markdown": 0.1, "news": 0.15, "scrape": 0.1, "pathological": 0.002}
+
+NEWS = {
+    "de": "Die Bundesregierung hat am Mittwoch in Berlin neue Maßnahmen für Bürger und Unternehmen beschlossen. "
+    "Nach Angaben des Ministeriums sollen die Änderungen ab 1. März gelten, die Grünen übten scharfe Kritik.",
+    "fr": "Le gouvernement a annoncé mercredi à Paris une réforme très attendue. Selon le ministère, "
+    "les premières mesures entreront en vigueur dès l'été, a déclaré la porte-parole à la presse.",
+    "es": "El Gobierno aprobó el miércoles en Madrid un paquete de medidas económicas. Según fuentes del "
+    "ministerio, la reforma afectará a más de dos millones de españoles a partir del próximo año.",
+    "sv": "Regeringen presenterade på onsdagen ett förslag om höjda bidrag. Enligt departementet "
+    "träder ändringarna i kraft i början av nästa år, säger ministern till Sveriges Radio.",
+    "el": "Η κυβέρνηση ανακοίνωσε την Τετάρτη νέα μέτρα στήριξης για τα νοικοκυριά. Σύμφωνα με το υπουργείο, "
+    "τα μέτρα θα ισχύσουν από τον επόμενο μήνα.",
+    "ru": "Правительство в среду объявило о новых мерах поддержки граждан. По данным министерства, "
+    "изменения вступят в силу с первого марта следующего года.",
+    "zh": "政府周三宣布了一系列新的经济措施。据该部门称，这些改革将于明年年初生效，预计将惠及数百万家庭。",
+}
+
+EMOJI = ["🎉", "👍🏽", "😂", "❤️", "🔥", "🙈", "👩🏾‍🎓", "🇩🇪", "✨", "🤔"]
+TLDS = ["com", "org", "de", "co.uk", "io", "net"]
+# UTF-8 text decoded as cp1252, i.e. mojibake as it shows up in scrapes
+MOJIBAKE = ["Ã¼", "Ã¶", "Ã¤", "ÃŸ", "â€™", "â€œ", "â€\x9d", "Ã©", "Ã¨", "â€”", "Â\xa0"]
+ENTITIES = ["&amp;", "&lt;", "&gt;", "&quot;", "&nbsp;", "&#39;", "&eacute;"]
+
+
+class _Generator:
+    def __init__(self, seed):
+        self.rng = random.Random(seed)
+        # a Zipf-like vocabulary of made-up words, so texts are varied but share their frequent words
+        self.vocabulary = [self._word() for _ in range(5_000)]
+        self.weights = [1 / (rank + 1) for rank in range(len(self.vocabulary))]
+
+    def _word(self):
+        return "".join(self.rng.choices(string.ascii_lowercase, k=self.rng.randint(2, 10)))
+
+    def words(self, n):
+        return " ".join(self.rng.choices(self.vocabulary, weights=self.weights, k=n))
+
+    def sentence(self):
+        words = self.words(self.rng.randint(4, 18))
+        return words[0].upper() + words[1:] + self.rng.choice([".", ".", ".", "!", "?", "..."])
+
+    def paragraph(self, sentences):
+        return " ".join(self.sentence() for _ in range(sentences))
+
+    def length(self, median, sigma=1.0):
+        # lognormal: most texts are short, a few are much longer
+        return max(1, int(self.rng.lognormvariate(0, sigma) * median))
+
+    def url(self):
+        path = "/".join(self.words(self.rng.randint(0, 3)).split())
+        query = f"?id={self.rng.randint(1, 10**6)}&ref=" + self._word() if self.rng.random() < 0.3 else ""
+        return f"https://{self.rng.choice(['www.', ''])}{self._word()}.{self.rng.choice(TLDS)}/{path}{query}"
+
+    def email(self):
+        return f"{self._word()}.{self._word()}@{self._word()}.{self.rng.choice(TLDS)}"
+
+    def phone(self):
+        return self.rng.choice(
+            [
+                f"+1-{self.rng.randint(200, 999)}-{self.rng.randint(100, 999)}-{self.rng.randint(1000, 9999)}",
+                f"({self.rng.randint(200, 999)}) {self.rng.randint(100, 999)} {self.rng.randint(1000, 9999)}",
+                f"+49 30 {self.rng.randint(1000000, 9999999)}",
+            ]
+        )
+
+    def tweet(self):
+        parts = [self.words(self.length(12, 0.6))]
+        if self.rng.random() < 0.5:
+            parts.insert(0, f"@{self._word()}")
+        if self.rng.random() < 0.3:
+            parts.append(self.url())
+        if self.rng.random() < 0.4:
+            parts.append(" ".join(f"#{self._word()}" for _ in range(self.rng.randint(1, 3))))
+        if self.rng.random() < 0.4:
+            parts.append("".join(self.rng.choices(EMOJI, k=self.rng.randint(1, 4))))
+        if self.rng.random() < 0.2:
+            parts.append(f"{self.rng.randint(2, 99)}% off, only ${self.rng.randint(1, 500)}.99!")
+        return " ".join(parts)
+
+    def email_message(self):
+        name = self._word().capitalize()
+        lines = [f"Hi {name},", ""]
+        lines += [self.paragraph(self.rng.randint(1, 4)) for _ in range(self.length(2, 0.7))]
+        if self.rng.random() < 0.4:
+            lines += ["", f"On Mon, {self._word().capitalize()} <{self.email()}> wrote:"]
+            lines += ["> " + self.sentence() for _ in range(self.rng.randint(1, 8))]
+        lines += [
+            "",
+            "Best regards,",
+            f"{name} {self._word().capitalize()}",
+            f"Phone: {self.phone()}",
+            f"Email: {self.email()}",
+            self.url(),
+            "",
+            "CONFIDENTIALITY NOTICE: " + self.paragraph(2),
+        ]
+        return "\n".join(lines)
+
+    def markdown(self):
+        lines = [f"# {self.sentence()}", ""]
+        for _ in range(self.length(3, 0.8)):
+            kind = self.rng.random()
+            if kind < 0.4:
+                lines.append(self.paragraph(self.rng.randint(1, 5)).replace(" is ", " `is` ", 1))
+            elif kind < 0.6:
+                lines += [f"- {self.sentence()}" for _ in range(self.rng.randint(2, 5))]
+            elif kind < 0.8:
+                code = "\n".join(
+                    f"    {self._word()} = {self._word()}({self.rng.randint(0, 99)})"
+                    for _ in range(self.rng.randint(1, 8))
+                )
+                lines.append(f"```python\ndef {self._word()}():\n{code}\n```")
+            else:
+                lines.append(f"See [{self._word()}]({self.url()}) and `./src/{self._word()}.py`.")
+            lines.append("")
+        return "\n".join(lines)
+
+    def news(self):
+        lang = self.rng.choice(list(NEWS))
+        sentences = NEWS[lang].split(". ")
+        n = self.length(4, 0.6)
+        return " ".join(self.rng.choice(sentences).rstrip(".") + "." for _ in range(n))
+
+    def scrape(self):
+        words = self.paragraph(self.length(4, 0.8)).split(" ")
+        for i in range(len(words)):
+            roll = self.rng.random()
+            if roll < 0.05:
+                words[i] += self.rng.choice(MOJIBAKE)
+            elif roll < 0.08:
+                words[i] = self.rng.choice(ENTITIES) + words[i]
+            elif roll < 0.1:
+                words[i] += self.rng.choice([" ", "  ", "\t", "\r\n", "\u200b"])
+        return " ".join(words)
+
+    def pathological(self):
+        size = self.length(20_000, 0.5)
+        unit = self.rng.choice(
+            [
+                lambda: self._word(),  # one huge word
+                lambda: self._word() + ".",  # dotted, like a hostname without end
+                lambda: self._word() + "-",
+                lambda: "a" * self.rng.randint(1, 30) + "@",  # @ without a valid domain
+                lambda: "`" * self.rng.randint(1, 3) + self._word(),  # unterminated code
+                lambda: str(self.rng.randint(0, 999)) + self.rng.choice([".", ",", ":", "/"]),
+            ]
+        )
+        pieces = []
+        length = 0
+        while length < size:
+            piece = unit()
+            pieces.append(piece)
+            length += len(piece)
+        return "".join(pieces)
+
+
+def generate(n=None, size_mb=None, seed=0, mix=None):
+    """
+    Return a list of ``(kind, text)`` tuples, either ``n`` of them or about ``size_mb``
+    megabytes of UTF-8 text. ``mix`` maps each kind to its share of the texts.
+    """
+    if (n is None) == (size_mb is None):
+        raise ValueError("Pass either n or size_mb")
+    mix = mix or MIX
+    generator = _Generator(seed)
+    makers = {
+        "tweet": generator.tweet,
+        "email": generator.email_message,
+        "markdown": generator.markdown,
+        "news": generator.news,
+        "scrape": generator.scrape,
+        "pathological": generator.pathological,
+    }
+    kinds = list(mix)
+    weights = [mix[kind] for kind in kinds]
+    corpus = []
+    size = 0
+    while (n is not None and len(corpus) < n) or (size_mb is not None and size < size_mb * 1e6):
+        kind = generator.rng.choices(kinds, weights=weights)[0]
+        text = makers[kind]()
+        corpus.append((kind, text))
+        size += len(text.encode("utf-8"))
+    return corpus
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic corpus as JSON lines.")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("-n", type=int, help="number of texts")
+    group.add_argument("--size-mb", type=float, help="size of the corpus in MB (default: 10)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", default="-", help="output file, default: stdout")
+    args = parser.parse_args(argv)
+    if args.n is None and args.size_mb is None:
+        args.size_mb = 10
+
+    corpus = generate(n=args.n, size_mb=args.size_mb, seed=args.seed)
+    f = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        for kind, text in corpus:
+            f.write(json.dumps({"kind": kind, "text": text}, ensure_ascii=False) + "\n")
+    finally:
+        if f is not sys.stdout:
+            f.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,6 @@
 __version__ = "0.7.1"
 
+from .cache import ResultCache  # noqa: F401
 from .clean import *
+from .parallel import CleaningPool, iter_clean_texts  # noqa: F401
+from .profiler import Profiler  # noqa: F401
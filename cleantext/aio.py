@@ -0,0 +1,131 @@
+"""
+Asyncio interface to clean texts without blocking the event loop.
+"""
+
+import asyncio
+import os
+from collections import deque
+
+from .clean import _get_cleaner
+from .parallel import _iter_chunks
+
+# (loop, executor, max_in_flight) -> [semaphore, number of `aclean` calls using it]; entries are
+# removed when their last call returns, so loops and executors are not kept alive
+_limits = {}
+
+
+def _max_in_flight(max_in_flight):
+    if max_in_flight is None:
+        return 2 * (os.cpu_count() or 1)
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1")
+    return max_in_flight
+
+
+def _cleaner(kwargs):
+    exceptions = kwargs.get("exceptions")
+    return _get_cleaner(**dict(kwargs, exceptions=tuple(exceptions) if exceptions else None))
+
+
+async def _achunks(texts, chunksize):
+    if not hasattr(texts, "__aiter__"):
+        for chunk in _iter_chunks(texts, chunksize):
+            yield chunk
+        return
+    chunk = []
+    async for text in texts:
+        chunk.append(text)
+        if len(chunk) == chunksize:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def aclean(text, *, executor=None, max_in_flight=None, **kwargs):
+    """Clean ``text`` in ``executor`` and return the result, see :func:`clean`.
+
+    Concurrent calls on the same loop with the same ``executor`` and
+    ``max_in_flight`` submit at most ``max_in_flight`` texts at a time, the
+    others wait for a free slot instead of queueing up in the executor.
+
+    Args:
+        text (str): raw text to clean.
+        executor (concurrent.futures.Executor): where to clean, defaults to the
+            loop's default executor (threads). Use a shared
+            ``ProcessPoolExecutor`` to keep CPU-heavy cleaning off the
+            event loop's process entirely.
+        max_in_flight (int): maximum number of texts submitted at a time
+            (default: two per CPU).
+        **kwargs: keyword arguments for :func:`clean`.
+    """
+    max_in_flight = _max_in_flight(max_in_flight)
+    cleaner = _cleaner(kwargs)
+    loop = asyncio.get_running_loop()
+    key = (loop, executor, max_in_flight)
+    limit = _limits.get(key)
+    if limit is None:
+        limit = _limits[key] = [asyncio.Semaphore(max_in_flight), 0]
+    limit[1] += 1
+    try:
+        async with limit[0]:
+            return await loop.run_in_executor(executor, cleaner, text)
+    finally:
+        limit[1] -= 1
+        if not limit[1]:
+            del _limits[key]
+
+
+async def aiter_clean_texts(texts, *, executor=None, chunksize=64, max_in_flight=None, **kwargs):
+    """Lazily clean an iterable or async iterable of texts in ``executor``.
+
+    Texts are sent to the executor in chunks of ``chunksize`` and at most
+    ``max_in_flight`` chunks (default: two per CPU) are queued or being cleaned
+    at any time. Cleaned texts are yielded in input order. When the consumer
+    stops early or is cancelled, chunks that have not started are cancelled.
+
+    Args:
+        texts: iterable or async iterable of strings to clean.
+        executor (concurrent.futures.Executor): see :func:`aclean`.
+        chunksize (int): number of texts per task.
+        max_in_flight (int): maximum number of chunks submitted at a time.
+        **kwargs: keyword arguments for :func:`clean`.
+
+    Yields:
+        str: cleaned texts in the same order as *texts*.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    max_in_flight = _max_in_flight(max_in_flight)
+    cleaner = _cleaner(kwargs)
+    loop = asyncio.get_running_loop()
+
+    window = deque()
+    try:
+        async for chunk in _achunks(texts, chunksize):
+            window.append(loop.run_in_executor(executor, cleaner.map, chunk))
+            if len(window) >= max_in_flight:
+                for text in await window.popleft():
+                    yield text
+        while window:
+            for text in await window.popleft():
+                yield text
+    finally:
+        for future in window:
+            future.cancel()
+
+
+async def aclean_texts(texts, *, executor=None, chunksize=64, max_in_flight=None, **kwargs):
+    """Clean an iterable or async iterable of texts in ``executor`` and return a list.
+
+    See :func:`aiter_clean_texts` for the arguments.
+
+    Example:
+        >>> with ProcessPoolExecutor() as executor:
+        ...     cleaned = await aclean_texts(posts, executor=executor, no_urls=True)
+    """
+    generator = aiter_clean_texts(texts, executor=executor, chunksize=chunksize, max_in_flight=max_in_flight, **kwargs)
+    try:
+        return [text async for text in generator]
+    finally:
+        await generator.aclose()
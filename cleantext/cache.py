@@ -0,0 +1,154 @@
+"""
+Memoization of cleaning results for inputs with many duplicates.
+"""
+
+import sys
+from collections import OrderedDict
+from threading import Lock
+
+from .profiler import Profiler
+
+
+class ResultCache:
+    """
+    A bounded LRU cache of cleaned texts, keyed by the text and the cleaning configuration.
+
+    Pass it as ``cache`` to :func:`clean` or :func:`clean_texts` to clean texts
+    that were seen before (retweets, signatures, boilerplate) for the price of a
+    dict lookup. One cache may be shared by several configurations and threads.
+    When either bound is exceeded, the least recently used results are evicted.
+
+    Args:
+        maxsize (int): maximum number of cached results, ``None`` for no limit.
+        max_bytes (int): maximum memory taken by the cached texts and results
+            (as reported by ``sys.getsizeof``), ``None`` for no limit.
+        max_text_length (int): longer texts are cleaned without being cached,
+            they are unlikely to repeat. ``None`` for no limit.
+
+    Example:
+        >>> cache = ResultCache(maxsize=100_000)
+        >>> cleaned = clean_texts(tweets, no_urls=True, cache=cache)
+        >>> cache.hits, cache.misses
+        (81234, 18766)
+    """
+
+    def __init__(self, maxsize=65536, max_bytes=64 * 2**20, max_text_length=4096):
+        for name, value in (("maxsize", maxsize), ("max_bytes", max_bytes), ("max_text_length", max_text_length)):
+            if value is not None and (not isinstance(value, int) or value < 0):
+                raise ValueError(f"{name} must be a non-negative integer or None, got {value!r}")
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.max_text_length = max_text_length
+        # (cleaner, text) -> (result, size in bytes), least recently used first
+        self._data = OrderedDict()
+        self._lock = Lock()
+        #: memory taken by the cached texts and results
+        self.nbytes = 0
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Reset :attr:`hits`, :attr:`misses`, :attr:`evictions` and :attr:`skipped`."""
+        #: number of lookups answered from the cache
+        self.hits = 0
+        #: number of lookups that had to clean the text
+        self.misses = 0
+        #: number of results dropped to stay within the bounds
+        self.evictions = 0
+        #: number of texts not looked up because they are too long (or not strings)
+        self.skipped = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def clear(self):
+        """Remove all cached results, the statistics are kept."""
+        with self._lock:
+            self._data.clear()
+            self.nbytes = 0
+
+    def _cacheable(self, text):
+        return type(text) is str and (self.max_text_length is None or len(text) <= self.max_text_length)
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def _put(self, key, result):
+        size = sys.getsizeof(key[1]) + sys.getsizeof(result)
+        if self.maxsize == 0 or (self.max_bytes is not None and size > self.max_bytes):
+            return
+        with self._lock:
+            if key in self._data:
+                return
+            self._data[key] = (result, size)
+            self.nbytes += size
+            while (self.maxsize is not None and len(self._data) > self.maxsize) or (
+                self.max_bytes is not None and self.nbytes > self.max_bytes
+            ):
+                _, (_, evicted_size) = self._data.popitem(last=False)
+                self.nbytes -= evicted_size
+                self.evictions += 1
+
+    def clean(self, cleaner, text, profiler=None):
+        """
+        Clean ``text`` with the :class:`Cleaner` ``cleaner``, or return the cached result.
+        Only cleaning is timed into ``profiler``, not the lookup.
+        """
+        if not self._cacheable(text):
+            self.skipped += 1
+            return cleaner(text, profiler)
+        key = (cleaner, text)
+        result = self._get(key)
+        if result is None:
+            result = cleaner(text, profiler)
+            self._put(key, result)
+        return result
+
+    def map(self, cleaner, texts, clean_many=None, profiler=None):
+        """
+        Clean the list ``texts`` with ``cleaner`` and return the results in the same order.
+
+        Only the texts that are not cached (each distinct text once) are passed as
+        a list to ``clean_many``, which defaults to ``cleaner.map``. With a
+        :class:`Profiler` ``profiler``, ``clean_many`` also gets a profiler for
+        these texts, which is merged into ``profiler`` afterwards.
+        """
+        results = [None] * len(texts)
+        # text -> indices in `texts` of the texts that need cleaning
+        missing = {}
+        uncacheable = []
+        for i, text in enumerate(texts):
+            if not self._cacheable(text):
+                self.skipped += 1
+                uncacheable.append(i)
+                continue
+            result = self._get((cleaner, text))
+            if result is None:
+                missing.setdefault(text, []).append(i)
+            else:
+                results[i] = result
+
+        todo = list(missing) + [texts[i] for i in uncacheable]
+        if not todo:
+            return results
+        clean_many = clean_many or cleaner.map
+        if profiler is None:
+            cleaned = clean_many(todo)
+        else:
+            todo_profiler = Profiler(*profiler._settings())
+            cleaned = clean_many(todo, todo_profiler)
+            # the slowest texts are reported by their first position in `texts`
+            profiler.merge(todo_profiler, [indices[0] for indices in missing.values()] + uncacheable)
+        for text, result in zip(missing, cleaned):
+            self._put((cleaner, text), result)
+            for i in missing[text]:
+                results[i] = result
+        for i, result in zip(uncacheable, cleaned[len(missing) :]):
+            results[i] = result
+        return results
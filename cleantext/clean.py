@@ -5,17 +5,15 @@ Clean your text to create normalized text represenations.
 import logging
 import os
 import re
-import sys
-from functools import partial
-from multiprocessing import Pool
-from unicodedata import category
+from collections import Counter
+from functools import lru_cache, partial
+from time import perf_counter
 
-import emoji
-from emoji import demojize, emojize
 from ftfy import fix_text
 
 from . import constants
-from .specials import save_replace, specials_map
+from .profiler import Profiler
+from .specials import transliterate
 
 log = logging.getLogger()
 
@@ -78,25 +76,31 @@ def to_ascii_unicode(text, lang="en", no_emoji=False):
     """
     # normalize quotes before since this improves transliteration quality
     text = fix_strange_quotes(text)
-
-    if not no_emoji:
-        text = demojize(text, language="alias")
+    if text.isascii():
+        return text
 
     lang = lang.lower()
-    # special handling for German text to preserve umlauts
-    if lang in specials_map:
-        text = save_replace(text, lang=lang)
-
-    text = unidecode(text)
-
-    # important to remove utility characters
-    if lang in specials_map:
-        text = save_replace(text, lang=lang, back=True)
-
-    if not no_emoji:
-        text = emojize(text, language="alias")
-
-    return text
+    if no_emoji:
+        # unidecode drops emoji
+        return transliterate(text, lang, unidecode)
+
+    # special handling for German text & co. to preserve umlauts, emoji are kept as they are
+    parts = []
+    start = 0
+    for match in constants.emoji_regex().finditer(text):
+        parts.append(transliterate(text[start : match.start()], lang, unidecode))
+        parts.append(match.group())
+        start = match.end()
+    parts.append(transliterate(text[start:], lang, unidecode))
+    return "".join(parts)
+
+
+def _to_ascii_unicode_ascii(text):
+    """
+    :func:`to_ascii_unicode` for text that is already ASCII: the backtick is the
+    only ASCII character among the strange quotes, nothing else can change.
+    """
+    return text.replace("`", "'")
 
 
 def normalize_whitespace(text, no_line_breaks=False, strip_lines=True, keep_two_line_breaks=False):
@@ -118,11 +122,6 @@ def normalize_whitespace(text, no_line_breaks=False, strip_lines=True, keep_two_
     return text.strip()
 
 
-# used below to keep `normalize_whitespace` as a parameter in `clean`
-def _normalize_whitespace(*kwargs):
-    return normalize_whitespace(*kwargs)
-
-
 def replace_urls(text, replace_with="<URL>"):
     """
     Replace all URLs in ``text`` str with ``replace_with`` str.
@@ -163,7 +162,7 @@ def replace_digits(text, replace_with="0"):
     """
     Replace all digits in ``text`` str with ``replace_with`` str, i.e., 123.34 to 000.00
     """
-    return re.sub(r"\d", replace_with, text)
+    return constants.DIGITS_REGEX.sub(replace_with, text)
 
 
 def replace_currency_symbols(text, replace_with="<CUR>"):
@@ -188,18 +187,16 @@ def replace_punct(text, replace_with=" "):
     """
     Replace punctuations from ``text`` with whitespaces (or other tokens).
     """
-    return text.translate(
-        dict.fromkeys(
-            (i for i in range(sys.maxunicode) if category(chr(i)).startswith("P")),
-            replace_with,
-        )
-    )
+    return text.translate(constants.punct_translate_table(replace_with))
 
 
 def remove_punct(text):
     """
     Remove punctuations from ``text``.
     """
+    if text.isascii():
+        # `str.translate` only takes its fast path for ASCII text when deleted characters map to None
+        return text.translate(constants.punct_translate_table(None))
     return text.translate(constants.PUNCT_TRANSLATE_UNICODE)
 
 
@@ -221,50 +218,543 @@ def replace_file_paths(text, replace_with="<FILE_PATH>"):
 
 
 def remove_emoji(text):
-    return emoji.replace_emoji(text, replace="")
+    # all emoji are non-ASCII
+    if text.isascii():
+        return text
+    return constants.emoji_removal_regex().sub("", text)
+
+
+# steps that can be fused into a single scan: (regex in `constants`, argument holding the token,
+# character class every match of the regex starts with)
+_ENTITY_STEPS = {
+    "no_code": ("CODE_REGEX", "replace_with_code", "`"),
+    "no_urls": ("URL_REGEX", "replace_with_url", "hHfFwW"),
+    "no_emails": ("EMAIL_REGEX", "replace_with_email", r"\w+-"),
+    "no_phone_numbers": ("PHONE_REGEX", "replace_with_phone_number", r"\d+("),
+    "no_ip_addresses": ("IP_REGEX", "replace_with_ip_address", r"\da-fA-F:"),
+    "no_file_paths": ("FILE_PATH_REGEX", "replace_with_file_path", r"~./A-Za-z"),
+    "no_numbers": ("NUMBERS_REGEX", "replace_with_number", r"\d+\-–.,"),
+}
+
+_INLINE_FLAGS = [(re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"), (re.VERBOSE, "x")]
+
+
+@lru_cache(maxsize=32)
+def _entity_scanner(steps):
+    """
+    Compile the regexes of the entity ``steps`` into one alternation with a named
+    group per step. The flags of each regex are kept by scoping them to its group.
+    Each alternative is guarded by a lookahead for its possible first characters,
+    so positions where it cannot match are skipped cheaply.
+    """
+    alternatives = []
+    for step in steps:
+        name, _, first_chars = _ENTITY_STEPS[step]
+        regex = getattr(constants, name)
+        flags = "".join(letter for flag, letter in _INLINE_FLAGS if regex.flags & flag)
+        alternatives.append(f"(?P<{step}>(?=[{first_chars}])(?{flags}:{regex.pattern}))")
+    return re.compile("|".join(alternatives))
+
+
+def replace_entities(text, steps, tokens):
+    """
+    Replace code, URLs, emails, phone numbers, IP addresses, file paths and numbers
+    in a single scan over ``text``.
+    Args:
+        text (str): raw text
+        steps (tuple[str]): names of the entity steps of :func:`clean` to apply,
+            e.g. ``("no_urls", "no_emails")``; on overlapping matches, the match
+            starting first wins and ties go to the step listed first
+        tokens (dict): maps each step to its replacement token, inserted literally
+    """
+    return _entity_scanner(tuple(steps)).sub(lambda m: tokens[m.lastgroup], text)
+
+
+def _fuse_entity_stages(stages, config):
+    """Merge each run of consecutive entity steps in ``stages`` into one ``entities`` step."""
+    fused = []
+    run = []
+    for stage in stages + [(None, None, None)]:
+        if stage[0] in _ENTITY_STEPS:
+            run.append(stage)
+            continue
+        if len(run) > 1:
+            steps = tuple(name for name, _, _ in run)
+            tokens = {name: config[_ENTITY_STEPS[name][1]] for name in steps}
+            prechecks = tuple(precheck for _, _, precheck in run)
+            fused.append(
+                (
+                    "entities",
+                    partial(replace_entities, steps=steps, tokens=tokens),
+                    partial(_any_precheck, prechecks=prechecks),
+                )
+            )
+        else:
+            fused.extend(run)
+        run = []
+        if stage[0] is not None:
+            fused.append(stage)
+    return fused
+
+
+def _has_digit(text):
+    return constants.DIGITS_REGEX.search(text) is not None
+
+
+def _may_contain_url(text):
+    return "://" in text or constants.WWW_REGEX.search(text) is not None
+
+
+def _may_contain_email(text):
+    return "@" in text or constants.AT_REGEX.search(text) is not None
+
+
+def _may_contain_ip_address(text):
+    # IPv6 needs a colon, IPv4 dotted digits
+    return ":" in text or ("." in text and _has_digit(text))
+
+
+def _may_contain_file_path(text):
+    return "/" in text or "\\" in text
+
+
+def _may_contain_currency_symbol(text):
+    return any(symbol in text for symbol in constants.CURRENCIES)
+
+
+def _may_contain_code(text):
+    return "`" in text
+
+
+def _has_non_ascii(text):
+    return not text.isascii()
+
+
+def _any_precheck(text, prechecks):
+    return any(precheck(text) for precheck in prechecks)
+
+
+# cheap necessary conditions for a step to change the text, the step is skipped if they fail
+_PRECHECKS = {
+    "no_currency_symbols": _may_contain_currency_symbol,
+    "no_code": _may_contain_code,
+    "no_urls": _may_contain_url,
+    "no_emails": _may_contain_email,
+    "no_phone_numbers": _has_digit,
+    "no_ip_addresses": _may_contain_ip_address,
+    "no_file_paths": _may_contain_file_path,
+    "no_numbers": _has_digit,
+    "no_digits": _has_digit,
+    "no_emoji": _has_non_ascii,
+}
 
 
 def _encode_index(n):
-    """Encode a non-negative integer as a base-26 lowercase letter string.
+    """Encode a non-negative integer as a base-25 string of the letters a-y.
 
-    0 → 'a', 1 → 'b', ..., 25 → 'z', 26 → 'ba', 27 → 'bb', ...
+    0 → 'a', 1 → 'b', ..., 24 → 'y', 25 → 'aa', 26 → 'ab', ...
+    The letter z is left out because it delimits the placeholders.
     """
     if n < 0:
         raise ValueError("n must be non-negative")
     letters = []
     while True:
-        letters.append(chr(ord("a") + n % 26))
-        n = n // 26 - 1
+        letters.append(chr(ord("a") + n % 25))
+        n = n // 25 - 1
         if n < 0:
             break
     return "".join(reversed(letters))
 
 
+_EXCEPTION_PLACEHOLDER_REGEX = re.compile("zxzexcept[a-y]+zxz")
+
+# backreferences and conditionals refer to groups by number, which an alternation shifts, and
+# global inline flags such as `(?i)` would apply to all patterns (Python < 3.11 only warns
+# about them not being at the start)
+_UNCOMBINABLE_REGEX = re.compile(r"\\(?:[1-9]|g<)|\(\?\(|\(\?[aiLmsux]+\)")
+
+
+def _compile_exceptions(patterns):
+    """
+    Compile the ``exceptions`` patterns into a tuple of regexes: a single alternation
+    if they can be combined, otherwise one regex per pattern.
+    """
+    compiled = tuple(re.compile(pattern) for pattern in patterns)
+    if len(compiled) < 2 or any(
+        # compiled patterns keep their own flags
+        not isinstance(pattern, str) or _UNCOMBINABLE_REGEX.search(pattern)
+        for pattern in patterns
+    ):
+        return compiled
+    try:
+        return (re.compile("|".join(f"(?:{pattern})" for pattern in patterns)),)
+    except re.error:
+        # e.g. duplicate group names or global flags not at the start
+        return compiled
+
+
 def _protect_exceptions(text, exceptions):
-    """Replace regex-matched spans with inert placeholder tokens.
-
-    Returns ``(modified_text, originals)`` where *originals* is a list of
-    ``(placeholder, original_text)`` tuples needed by :func:`_restore_exceptions`.
-    """
-    originals = []
-    counter = 0
-    for pattern in exceptions:
-        compiled = re.compile(pattern)
-        matches = list(compiled.finditer(text))
-        # replace from back to front so indices stay valid
-        for m in reversed(matches):
-            placeholder = "zxzexcept" + _encode_index(counter) + "zxz"
-            originals.append((placeholder, m.group()))
-            text = text[: m.start()] + placeholder + text[m.end() :]
-            counter += 1
+    """Replace the matches of the compiled ``exceptions`` with inert placeholder tokens.
+
+    Returns ``(modified_text, originals)`` where *originals* maps each placeholder
+    to the original text, as needed by :func:`_restore_exceptions`.
+    """
+    originals = {}
+
+    def protect(match):
+        original = match.group()
+        if "zxzexcept" in original:
+            # a later pattern matched placeholders of an earlier one
+            original = _restore_exceptions(original, originals)
+        placeholder = "zxzexcept" + _encode_index(len(originals)) + "zxz"
+        originals[placeholder] = original
+        return placeholder
+
+    for regex in exceptions:
+        text = regex.sub(protect, text)
     return text, originals
 
 
 def _restore_exceptions(text, originals):
-    """Replace placeholder tokens with their original strings."""
-    for placeholder, original in originals:
-        text = text.replace(placeholder, original)
-    return text
+    """Replace placeholder tokens with their original strings in a single pass."""
+    if not originals:
+        return text
+    return _EXCEPTION_PLACEHOLDER_REGEX.sub(lambda m: originals.get(m.group(), m.group()), text)
+
+
+class Cleaner:
+    """
+    Reusable, precompiled equivalent of :func:`clean`.
+
+    The configuration is validated once and turned into an ordered list of only
+    the enabled cleaning steps, so calling the instance skips the per-call
+    argument dispatch of :func:`clean`. Instances are cheap to pickle (only the
+    configuration is sent) which makes them suitable for worker processes.
+    They can also be shared by threads, the statistics (:attr:`calls`,
+    :attr:`skipped`) are then approximate.
+
+    All arguments are the same as for :func:`clean`.
+
+    Example:
+        >>> cleaner = Cleaner(no_urls=True, lower=False)
+        >>> cleaner("Visit https://example.com")
+        'Visit <URL>'
+        >>> cleaner.map(["Hello  World", None])
+        ['Hello World', '']
+    """
+
+    def __init__(
+        self,
+        fix_unicode=True,
+        to_ascii=True,
+        lower=True,
+        normalize_whitespace=True,
+        no_line_breaks=False,
+        strip_lines=True,
+        keep_two_line_breaks=False,
+        no_code=False,
+        no_urls=False,
+        no_emails=False,
+        no_phone_numbers=False,
+        no_ip_addresses=False,
+        no_file_paths=False,
+        no_numbers=False,
+        no_digits=False,
+        no_currency_symbols=False,
+        no_punct=False,
+        no_emoji=False,
+        replace_with_code="<CODE>",
+        replace_with_url="<URL>",
+        replace_with_email="<EMAIL>",
+        replace_with_phone_number="<PHONE>",
+        replace_with_ip_address="<IP>",
+        replace_with_file_path="<FILE_PATH>",
+        replace_with_number="<NUMBER>",
+        replace_with_digit="0",
+        replace_with_currency_symbol="<CUR>",
+        replace_with_punct="",
+        lang="en",
+        exceptions=None,
+        fuse_entities=False,
+    ):
+        self._config = dict(
+            fix_unicode=fix_unicode,
+            to_ascii=to_ascii,
+            lower=lower,
+            normalize_whitespace=normalize_whitespace,
+            no_line_breaks=no_line_breaks,
+            strip_lines=strip_lines,
+            keep_two_line_breaks=keep_two_line_breaks,
+            no_code=no_code,
+            no_urls=no_urls,
+            no_emails=no_emails,
+            no_phone_numbers=no_phone_numbers,
+            no_ip_addresses=no_ip_addresses,
+            no_file_paths=no_file_paths,
+            no_numbers=no_numbers,
+            no_digits=no_digits,
+            no_currency_symbols=no_currency_symbols,
+            no_punct=no_punct,
+            no_emoji=no_emoji,
+            replace_with_code=replace_with_code,
+            replace_with_url=replace_with_url,
+            replace_with_email=replace_with_email,
+            replace_with_phone_number=replace_with_phone_number,
+            replace_with_ip_address=replace_with_ip_address,
+            replace_with_file_path=replace_with_file_path,
+            replace_with_number=replace_with_number,
+            replace_with_digit=replace_with_digit,
+            replace_with_currency_symbol=replace_with_currency_symbol,
+            replace_with_punct=replace_with_punct,
+            lang=lang,
+            exceptions=tuple(exceptions) if exceptions else None,
+            fuse_entities=fuse_entities,
+        )
+        self._validate()
+        self._hash = hash(tuple(self._config.items()))
+        # invalid patterns fail here instead of on the first text
+        self._exceptions = _compile_exceptions(self._config["exceptions"] or ())
+        self._stages = self._build_stages()
+        self._ascii_stages = self._build_ascii_stages()
+        self.reset_stats()
+
+    def _validate(self):
+        config = self._config
+        # only the arguments of enabled steps are used, so only those are checked
+        if config["to_ascii"] and not isinstance(config["lang"], str):
+            raise TypeError(f"lang must be a string, got {type(config['lang']).__name__}")
+        for flag, token in _REPLACEMENT_TOKENS:
+            if config[flag] and not isinstance(config[token], str):
+                # None removes punctuation and replaces currency symbols by their ISO codes
+                if token in ("replace_with_punct", "replace_with_currency_symbol") and config[token] is None:
+                    continue
+                raise TypeError(f"{token} must be a string, got {type(config[token]).__name__}")
+
+    def _build_stages(self):
+        """Return the ordered ``(name, function, precheck)`` triples of all enabled steps."""
+        config = self._config
+        stages = []
+
+        if config["fix_unicode"]:
+            stages.append(("fix_unicode", fix_bad_unicode))
+        if config["no_currency_symbols"]:
+            stages.append(
+                (
+                    "no_currency_symbols",
+                    partial(replace_currency_symbols, replace_with=config["replace_with_currency_symbol"]),
+                )
+            )
+        if config["no_code"]:
+            stages.append(("no_code", partial(replace_code, replace_with=config["replace_with_code"])))
+        if config["to_ascii"]:
+            stages.append(
+                ("to_ascii", partial(to_ascii_unicode, lang=config["lang"].lower(), no_emoji=config["no_emoji"]))
+            )
+        if config["no_urls"]:
+            stages.append(("no_urls", partial(replace_urls, replace_with=config["replace_with_url"])))
+        if config["no_emails"]:
+            stages.append(("no_emails", partial(replace_emails, replace_with=config["replace_with_email"])))
+        if config["no_phone_numbers"]:
+            stages.append(
+                (
+                    "no_phone_numbers",
+                    partial(replace_phone_numbers, replace_with=config["replace_with_phone_number"]),
+                )
+            )
+        if config["no_ip_addresses"]:
+            stages.append(
+                ("no_ip_addresses", partial(replace_ip_addresses, replace_with=config["replace_with_ip_address"]))
+            )
+        if config["no_file_paths"]:
+            stages.append(
+                ("no_file_paths", partial(replace_file_paths, replace_with=config["replace_with_file_path"]))
+            )
+        if config["no_numbers"]:
+            stages.append(("no_numbers", partial(replace_numbers, replace_with=config["replace_with_number"])))
+        if config["no_digits"]:
+            stages.append(("no_digits", partial(replace_digits, replace_with=config["replace_with_digit"])))
+        if config["no_punct"]:
+            if config["replace_with_punct"] in ("", None):
+                stages.append(("no_punct", remove_punct))
+            else:
+                stages.append(("no_punct", partial(replace_punct, replace_with=config["replace_with_punct"])))
+        if config["no_emoji"] and not config["to_ascii"]:
+            stages.append(("no_emoji", remove_emoji))
+        if config["lower"]:
+            stages.append(("lower", str.lower))
+        if config["normalize_whitespace"]:
+            stages.append(
+                (
+                    "normalize_whitespace",
+                    partial(
+                        normalize_whitespace,
+                        no_line_breaks=config["no_line_breaks"],
+                        strip_lines=config["strip_lines"],
+                        keep_two_line_breaks=config["keep_two_line_breaks"],
+                    ),
+                )
+            )
+        stages = [(name, step, _PRECHECKS.get(name)) for name, step in stages]
+        if config["fuse_entities"]:
+            stages = _fuse_entity_stages(stages, config)
+        return stages
+
+    def _build_ascii_stages(self):
+        """
+        Return the steps for ASCII text, leaving out those that cannot change it.
+        Returns None if there is no such shortcut for this configuration.
+        """
+        config = self._config
+        if config["to_ascii"]:
+            # replacements before `to_ascii` must keep the text ASCII
+            tokens = [config["replace_with_code"] if config["no_code"] else ""]
+            if config["no_currency_symbols"] and config["replace_with_currency_symbol"] is not None:
+                tokens.append(config["replace_with_currency_symbol"])
+            if not all(token.isascii() for token in tokens):
+                return None
+
+        stages = []
+        for name, step, precheck in self._stages:
+            # only taken if the text does not contain anything ftfy would fix, see `__call__`.
+            # `no_emoji` stays: steps before it may insert non-ASCII tokens, and its precheck is cheap
+            if name == "fix_unicode":
+                continue
+            if name == "to_ascii":
+                step = _to_ascii_unicode_ascii
+            stages.append((name, step, precheck))
+        return stages
+
+    @property
+    def config(self):
+        """The keyword arguments this cleaner was created with (a copy)."""
+        return dict(self._config)
+
+    @property
+    def stage_names(self):
+        """Names of the enabled steps in the order they are applied."""
+        return [name for name, _, _ in self._stages]
+
+    def reset_stats(self):
+        """Reset :attr:`calls` and :attr:`skipped`."""
+        #: number of texts cleaned (in this process)
+        self.calls = 0
+        #: how often each step was skipped because its precheck ruled out a match
+        self.skipped = Counter()
+
+    def __call__(self, text, profiler=None, index=None):
+        """
+        Clean a single ``text``, see :func:`clean`. The steps are timed into ``profiler``
+        if given, which reports ``index`` as the position of ``text`` in its batch.
+        """
+        if text is None:
+            return ""
+
+        text = str(text)
+        self.calls += 1
+        if profiler is not None:
+            return self._profiled_call(text, profiler, index)
+
+        if self._exceptions:
+            text, exc_originals = _protect_exceptions(text, self._exceptions)
+
+        text = self._apply(text, self._select_stages(text))
+
+        if self._exceptions:
+            text = _restore_exceptions(text, exc_originals)
+
+        return text
+
+    def _select_stages(self, text):
+        if (
+            self._ascii_stages is not None
+            and text.isascii()
+            and not (self._config["fix_unicode"] and constants.ASCII_FIX_UNICODE_REGEX.search(text))
+        ):
+            return self._ascii_stages
+        return self._stages
+
+    def _apply(self, text, stages):
+        for name, step, precheck in stages:
+            if precheck is not None and not precheck(text):
+                self.skipped[name] += 1
+                continue
+            text = step(text)
+        return text
+
+    def _profiled_call(self, text, profiler, index):
+        """:meth:`__call__` that records the time and the lengths before and after each step."""
+        # (stage, seconds, chars in, chars out)
+        timings = []
+        original = text
+        start = first_start = perf_counter()
+
+        if self._exceptions:
+            protected, exc_originals = _protect_exceptions(text, self._exceptions)
+            timings.append(("protect_exceptions", perf_counter() - start, len(text), len(protected)))
+            text = protected
+
+        for name, step, precheck in self._select_stages(text):
+            if precheck is not None and not precheck(text):
+                self.skipped[name] += 1
+                continue
+            start = perf_counter()
+            cleaned = step(text)
+            timings.append((name, perf_counter() - start, len(text), len(cleaned)))
+            text = cleaned
+
+        if self._exceptions:
+            start = perf_counter()
+            restored = _restore_exceptions(text, exc_originals)
+            timings.append(("restore_exceptions", perf_counter() - start, len(text), len(restored)))
+            text = restored
+
+        timings.append(("total", perf_counter() - first_start, len(original), len(text)))
+        profiler._record(timings, original, index)
+        return text
+
+    def map(self, texts, profiler=None):
+        """Clean every item of the iterable ``texts`` and return a list, see :meth:`__call__`."""
+        if profiler is None:
+            return [self(t) for t in texts]
+        return [self(t, profiler, i) for i, t in enumerate(texts)]
+
+    def __eq__(self, other):
+        if not isinstance(other, Cleaner):
+            return NotImplemented
+        return self._config == other._config
+
+    def __hash__(self):
+        # computed once, cleaners are part of the keys of `ResultCache`
+        return self._hash
+
+    def __reduce__(self):
+        # only ship the configuration, the steps are rebuilt (and cached) on the other side
+        return (_cleaner_from_config, (self._config,))
+
+
+# (flag enabling a step, keyword argument holding its replacement token)
+_REPLACEMENT_TOKENS = [
+    ("no_code", "replace_with_code"),
+    ("no_urls", "replace_with_url"),
+    ("no_emails", "replace_with_email"),
+    ("no_phone_numbers", "replace_with_phone_number"),
+    ("no_ip_addresses", "replace_with_ip_address"),
+    ("no_file_paths", "replace_with_file_path"),
+    ("no_numbers", "replace_with_number"),
+    ("no_digits", "replace_with_digit"),
+    ("no_currency_symbols", "replace_with_currency_symbol"),
+    ("no_punct", "replace_with_punct"),
+]
+
+
+@lru_cache(maxsize=128)
+def _get_cleaner(**config):
+    """Return a (cached) :class:`Cleaner` for the hashable keyword arguments ``config``."""
+    return Cleaner(**config)
+
+
+def _cleaner_from_config(config):
+    return _get_cleaner(**config)
 
 
 def clean(
@@ -299,6 +789,9 @@ def clean(
     replace_with_punct="",
     lang="en",
     exceptions=None,
+    fuse_entities=False,
+    cache=None,
+    profiler=None,
 ):
     """
     Normalize various aspects of a raw text. A convenience function for applying all other
@@ -343,60 +836,68 @@ def clean(
             French ('fr'), German ('de'), Icelandic ('is'), Italian ('it'),
             Norwegian ('no'), Scandinavian ('sv'), Spanish ('es'),
             and Swedish ('se') are supported
-        exceptions (list[str]): list of regex pattern strings whose matches
-            will be preserved verbatim through all cleaning steps.
+        exceptions (list[str]): list of regex pattern strings (or compiled patterns) whose matches
+            will be preserved verbatim through all cleaning steps. The patterns
+            are combined into one regex if possible, so where matches of
+            different patterns overlap, the match starting first wins (at the
+            same position, the pattern listed first).
+        fuse_entities (bool): if True, find code, URLs, emails, phone numbers,
+            IP addresses, file paths and numbers (whichever are enabled) in one
+            scan over the text instead of one pass per step. The result is the
+            same as step by step unless matches of different kinds overlap:
+            then the match starting first wins (ties go to the kind listed
+            first), whereas step by step the earlier step always wins. Also,
+            replacement tokens are inserted literally and never scanned again.
+            Code is only fused if ``to_ascii`` is False because ``to_ascii``
+            runs between code replacement and the other steps.
+        cache (ResultCache): look up the result in this cache and store it there,
+            worthwhile for inputs with many duplicates.
+        profiler (Profiler): record the time taken by each step (not for
+            results found in ``cache``).
 
     Returns:
         str: input ``text`` processed according to function args
-    """
-
-    if text is None:
-        return ""
-
-    text = str(text)
-
-    text, _exc_originals = _protect_exceptions(text, exceptions or [])
-
-    if fix_unicode:
-        text = fix_bad_unicode(text)
-    if no_currency_symbols:
-        text = replace_currency_symbols(text, replace_with_currency_symbol)
-    if no_code:
-        text = replace_code(text, replace_with_code)
-    if to_ascii:
-        text = to_ascii_unicode(text, lang=lang, no_emoji=no_emoji)
-    if no_urls:
-        text = replace_urls(text, replace_with_url)
-    if no_emails:
-        text = replace_emails(text, replace_with_email)
-    if no_phone_numbers:
-        text = replace_phone_numbers(text, replace_with_phone_number)
-    if no_ip_addresses:
-        text = replace_ip_addresses(text, replace_with_ip_address)
-    if no_file_paths:
-        text = replace_file_paths(text, replace_with_file_path)
-    if no_numbers:
-        text = replace_numbers(text, replace_with_number)
-    if no_digits:
-        text = replace_digits(text, replace_with_digit)
-    if no_punct:
-        if replace_with_punct == "":
-            text = remove_punct(text)
-        else:
-            text = replace_punct(text, replace_with_punct)
-
-    if no_emoji and not to_ascii:
-        text = remove_emoji(text)
-
-    if lower:
-        text = text.lower()
 
-    if normalize_whitespace:
-        text = _normalize_whitespace(text, no_line_breaks, strip_lines, keep_two_line_breaks)
-
-    text = _restore_exceptions(text, _exc_originals)
+    The arguments are compiled into a :class:`Cleaner` once and cached, so repeated
+    calls with the same arguments only pay for the enabled steps.
+    """
 
-    return text
+    cleaner = _get_cleaner(
+        fix_unicode=fix_unicode,
+        to_ascii=to_ascii,
+        lower=lower,
+        normalize_whitespace=normalize_whitespace,
+        no_line_breaks=no_line_breaks,
+        strip_lines=strip_lines,
+        keep_two_line_breaks=keep_two_line_breaks,
+        no_code=no_code,
+        no_urls=no_urls,
+        no_emails=no_emails,
+        no_phone_numbers=no_phone_numbers,
+        no_ip_addresses=no_ip_addresses,
+        no_file_paths=no_file_paths,
+        no_numbers=no_numbers,
+        no_digits=no_digits,
+        no_currency_symbols=no_currency_symbols,
+        no_punct=no_punct,
+        no_emoji=no_emoji,
+        replace_with_code=replace_with_code,
+        replace_with_url=replace_with_url,
+        replace_with_email=replace_with_email,
+        replace_with_phone_number=replace_with_phone_number,
+        replace_with_ip_address=replace_with_ip_address,
+        replace_with_file_path=replace_with_file_path,
+        replace_with_number=replace_with_number,
+        replace_with_digit=replace_with_digit,
+        replace_with_currency_symbol=replace_with_currency_symbol,
+        replace_with_punct=replace_with_punct,
+        lang=lang,
+        exceptions=tuple(exceptions) if exceptions else None,
+        fuse_entities=fuse_entities,
+    )
+    if cache is not None:
+        return cache.clean(cleaner, text, profiler)
+    return cleaner(text, profiler)
 
 
 def _resolve_n_jobs(n_jobs):
@@ -426,6 +927,9 @@ def clean_texts(
     texts,
     n_jobs=1,
     *,
+    executor="process",
+    transport="pickle",
+    pool=None,
     fix_unicode=True,
     to_ascii=True,
     lower=True,
@@ -456,6 +960,10 @@ def clean_texts(
     replace_with_punct="",
     lang="en",
     exceptions=None,
+    fuse_entities=False,
+    cache=None,
+    dedupe=False,
+    profiler=None,
 ):
     """Clean a list of texts, optionally in parallel using multiprocessing.
 
@@ -465,6 +973,24 @@ def clean_texts(
             ``1`` or ``None`` for sequential processing (default),
             ``-1`` to use all available CPU cores,
             any positive int for that many workers.
+        executor (str): what the workers are: ``"process"`` (default) for a
+            process pool, ``"thread"`` for threads or ``"interpreter"`` for
+            sub-interpreters (Python 3.14+). Threads need no pickling but only
+            run in parallel on free-threaded Python builds.
+        transport (str): how texts get to worker processes and back:
+            ``"pickle"`` (default) or ``"shared_memory"``, see
+            :meth:`CleaningPool.map`. Only for the ``"process"`` executor.
+        pool (CleaningPool): reuse the warm workers of this pool instead of
+            starting new processes; ``n_jobs`` is ignored. The cleaning
+            options default to the pool's configuration, passing different
+            ones raises ``ValueError``.
+        cache (ResultCache): only clean the texts that are not in this cache
+            (each distinct text once) and add their results to it.
+        dedupe (bool): if True, clean each distinct string only once and copy
+            the result to all its positions. Worthwhile for batches with many
+            duplicates, the share of duplicates is logged.
+        profiler (Profiler): record the time taken by each step. Workers
+            profile their share of the texts and the results are merged.
         **kwargs: all remaining keyword arguments are forwarded to
             :func:`clean` unchanged.
 
@@ -473,6 +999,12 @@ def clean_texts(
     """
     texts = list(texts)
     n_jobs = _resolve_n_jobs(n_jobs)
+    if executor not in ("process", "thread", "interpreter"):
+        raise ValueError(f"executor must be 'process', 'thread' or 'interpreter', got {executor!r}")
+    if transport not in ("pickle", "shared_memory"):
+        raise ValueError(f"transport must be 'pickle' or 'shared_memory', got {transport!r}")
+    if transport != "pickle" and executor != "process":
+        raise ValueError(f"transport {transport!r} requires the 'process' executor")
 
     kwargs = dict(
         fix_unicode=fix_unicode,
@@ -504,13 +1036,79 @@ def clean_texts(
         replace_with_currency_symbol=replace_with_currency_symbol,
         replace_with_punct=replace_with_punct,
         lang=lang,
-        exceptions=exceptions,
+        exceptions=tuple(exceptions) if exceptions else None,
+        fuse_entities=fuse_entities,
     )
 
-    worker = partial(clean, **kwargs)
+    cleaner = _get_cleaner(**kwargs)
+
+    if pool is not None:
+        if cleaner != pool.cleaner and cleaner != _get_cleaner():
+            raise ValueError("The cleaning options differ from the configuration of the given pool")
+        cleaner = pool.cleaner
+
+    if dedupe:
+        # position of each text in `unique`, only strings are collapsed (1 == True but
+        # they are cleaned differently)
+        first = {}
+        unique = []
+        positions = []
+        # position in `texts` of each text in `unique`
+        origins = []
+        for position, text in enumerate(texts):
+            if type(text) is str:
+                i = first.setdefault(text, len(unique))
+                if i == len(unique):
+                    unique.append(text)
+                    origins.append(position)
+            else:
+                i = len(unique)
+                unique.append(text)
+                origins.append(position)
+            positions.append(i)
+        if texts:
+            log.info(
+                "clean_texts: %d of %d texts are duplicates (%.1f%%)",
+                len(texts) - len(unique),
+                len(texts),
+                100 * (len(texts) - len(unique)) / len(texts),
+            )
+        # profile separately, so the slowest texts are reported by their position in `texts`
+        unique_profiler = None if profiler is None else Profiler(*profiler._settings())
+        cleaned = clean_texts(
+            unique,
+            n_jobs,
+            executor=executor,
+            transport=transport,
+            pool=pool,
+            cache=cache,
+            profiler=unique_profiler,
+            **kwargs,
+        )
+        if profiler is not None:
+            profiler.merge(unique_profiler, origins)
+        return [cleaned[i] for i in positions]
+
+    if cache is not None:
+        return cache.map(
+            cleaner,
+            texts,
+            lambda missing, missing_profiler=None: clean_texts(
+                missing, n_jobs, executor=executor, transport=transport, pool=pool, profiler=missing_profiler, **kwargs
+            ),
+            profiler,
+        )
+
+    if pool is not None:
+        return pool.map(texts, transport=transport, profiler=profiler)
 
     if n_jobs == 1 or len(texts) == 0:
-        return [worker(t) for t in texts]
+        return cleaner.map(texts, profiler)
+
+    from .parallel import CleaningPool, _executor_map
+
+    if executor != "process":
+        return _executor_map(cleaner, texts, min(n_jobs, len(texts)), executor, profiler)
 
-    with Pool(processes=min(n_jobs, len(texts))) as pool:
-        return pool.map(worker, texts)
+    with CleaningPool(n_jobs=min(n_jobs, len(texts)), cleaner=cleaner) as pool:
+        return pool.map(texts, transport=transport, profiler=profiler)
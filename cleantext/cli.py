@@ -0,0 +1,264 @@
+"""
+Command-line interface to clean plain text, JSONL or CSV files.
+
+Examples:
+    python -m cleantext corpus.txt.gz -o clean.txt --no-urls --lang de
+    cleantext tweets.jsonl --field text --field user.bio -j 4 > clean.jsonl
+    cat data.csv | cleantext --format csv --column comment --no-punct
+"""
+
+import argparse
+import csv
+import gzip
+import inspect
+import io
+import json
+import re
+import sys
+import time
+from contextlib import contextmanager
+from itertools import islice
+
+from .clean import Cleaner, clean
+from .parallel import CleaningPool
+
+FORMATS = ("lines", "jsonl", "csv")
+
+# options that don't map to a flag generated from the signature of `Cleaner`
+_SPECIAL_OPTIONS = ("exceptions",)
+
+# what `str.splitlines` splits on; cleaning may turn some of these into "\n"
+_LINE_BREAK_REGEX = re.compile("[\n\r\v\f\x1c-\x1e\x85\u2028\u2029]+")
+
+
+def _option_help():
+    """Return the first line of the description of each argument in the docstring of `clean`."""
+    helps = re.findall(r"^ {8}(\w+) \(\w+\): (?:if True, )?(.+)$", clean.__doc__, flags=re.MULTILINE)
+    # drop what's cut off at the end of the first line
+    helps = {name: re.sub(r",? *\([^)]*$|[,.]$", "", help) for name, help in helps}
+    # argparse formats help strings with %
+    return {name: help.replace("%", "%%") for name, help in helps.items()}
+
+
+def _add_clean_options(parser):
+    group = parser.add_argument_group("cleaning options (see `cleantext.clean`)")
+    helps = _option_help()
+    for name, param in inspect.signature(Cleaner).parameters.items():
+        if name in _SPECIAL_OPTIONS:
+            continue
+        flag = name.replace("_", "-")
+        help = helps.get(name, "")
+        if param.default is True:
+            group.add_argument(f"--no-{flag}", dest=name, action="store_false", help=f"set {name}=False")
+        elif param.default is False:
+            group.add_argument(f"--{flag}", dest=name, action="store_true", help=help)
+        else:
+            group.add_argument(f"--{flag}", dest=name, default=param.default, metavar="TEXT", help=help)
+    group.add_argument(
+        "--exception",
+        dest="exceptions",
+        action="append",
+        metavar="REGEX",
+        help="keep matches of this regex verbatim, may be given multiple times",
+    )
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="cleantext",
+        description="Clean a corpus of plain text lines, JSONL records or CSV rows. "
+        "Files ending in .gz are (de)compressed on the fly.",
+    )
+    parser.add_argument("input", nargs="?", default="-", help="input file, default: stdin")
+    parser.add_argument("-o", "--output", default="-", help="output file, default: stdout")
+    parser.add_argument(
+        "--format",
+        choices=FORMATS,
+        help="input format, default: guessed from the file extension (.jsonl/.ndjson, .csv) or lines",
+    )
+    parser.add_argument(
+        "--field",
+        action="append",
+        help="JSONL: field to clean, dots select nested fields, may be given multiple times (default: text)",
+    )
+    parser.add_argument(
+        "--column", action="append", help="CSV: column to clean, may be given multiple times (default: all)"
+    )
+    parser.add_argument("-j", "--n-jobs", type=int, default=1, help="number of worker processes, -1 for all cores")
+    parser.add_argument(
+        "--batch-size", type=int, default=10_000, help="number of records read and cleaned at a time (default: 10000)"
+    )
+    parser.add_argument("-q", "--quiet", action="store_true", help="don't print the throughput to stderr")
+    _add_clean_options(parser)
+    return parser
+
+
+def _guess_format(path):
+    path = path.lower()
+    if path.endswith(".gz"):
+        path = path[:-3]
+    if path.endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    if path.endswith(".csv"):
+        return "csv"
+    return "lines"
+
+
+@contextmanager
+def _open(path, mode):
+    # csv needs newline="" to handle line breaks inside quoted fields
+    if path == "-":
+        stream = sys.stdin if mode == "r" else sys.stdout
+        f = io.TextIOWrapper(stream.buffer, encoding="utf-8", newline="")
+        try:
+            yield f
+        finally:
+            # leave stdin/stdout open
+            f.flush()
+            f.detach()
+    elif path.endswith(".gz"):
+        with gzip.open(path, mode + "t", encoding="utf-8", newline="") as f:
+            yield f
+    else:
+        with open(path, mode, encoding="utf-8", newline="") as f:
+            yield f
+
+
+# The input is read and checked when a format is created, before the output is opened by `start`,
+# so invalid arguments don't leave a partial output behind
+class _Lines:
+    def __init__(self, f_in, args):
+        self.f_in = f_in
+
+    def start(self, f_out):
+        self.f_out = f_out
+
+    def records(self):
+        for line in self.f_in:
+            yield line.rstrip("\r\n")
+
+    def texts(self, record):
+        return [record]
+
+    def write(self, record, cleaned):
+        # one line per record, even if the cleaned text has line breaks
+        self.f_out.write(_LINE_BREAK_REGEX.sub(" ", cleaned[0]) + "\n")
+
+
+class _JSONL:
+    def __init__(self, f_in, args):
+        self.f_in = f_in
+        self.fields = [field.split(".") for field in args.field or ["text"]]
+
+    def start(self, f_out):
+        self.f_out = f_out
+
+    def records(self):
+        for line in self.f_in:
+            if line.strip():
+                yield json.loads(line)
+
+    def _parent(self, record, path):
+        for key in path[:-1]:
+            record = record.get(key) if isinstance(record, dict) else None
+        return record if isinstance(record, dict) and isinstance(record.get(path[-1]), str) else None
+
+    def texts(self, record):
+        # only string values are cleaned, missing fields are skipped
+        texts = []
+        for path in self.fields:
+            parent = self._parent(record, path)
+            if parent is not None:
+                texts.append(parent[path[-1]])
+        return texts
+
+    def write(self, record, cleaned):
+        cleaned = iter(cleaned)
+        for path in self.fields:
+            parent = self._parent(record, path)
+            if parent is not None:
+                parent[path[-1]] = next(cleaned)
+        self.f_out.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+class _CSV:
+    def __init__(self, f_in, args):
+        self.reader = csv.reader(f_in)
+        self.header = header = next(self.reader, None)
+        if header is None:
+            self.columns = []
+            return
+        if args.column:
+            missing = [column for column in args.column if column not in header]
+            if missing:
+                raise ValueError(f"Unknown columns: {', '.join(missing)}")
+            self.columns = [header.index(column) for column in args.column]
+        else:
+            self.columns = list(range(len(header)))
+
+    def start(self, f_out):
+        self.writer = csv.writer(f_out, lineterminator="\n")
+        if self.header is not None:
+            self.writer.writerow(self.header)
+
+    def records(self):
+        return self.reader
+
+    def texts(self, record):
+        return [record[i] for i in self.columns if i < len(record)]
+
+    def write(self, record, cleaned):
+        for i, text in zip((i for i in self.columns if i < len(record)), cleaned):
+            record[i] = text
+        self.writer.writerow(record)
+
+
+_READERS = {"lines": _Lines, "jsonl": _JSONL, "csv": _CSV}
+
+
+def run(args):
+    """Clean ``args.input`` into ``args.output`` and return the number of texts and characters cleaned."""
+    if args.batch_size < 1:
+        raise ValueError("--batch-size must be at least 1")
+    options = {name: getattr(args, name) for name in inspect.signature(Cleaner).parameters}
+    cleaner = Cleaner(**options)
+    fmt = args.format or _guess_format(args.input)
+    n_texts = 0
+    n_chars = 0
+
+    with _open(args.input, "r") as f_in:
+        io_format = _READERS[fmt](f_in, args)
+        with _open(args.output, "w") as f_out, CleaningPool(n_jobs=args.n_jobs, cleaner=cleaner) as pool:
+            io_format.start(f_out)
+            records = iter(io_format.records())
+            # records are read, cleaned and written in bounded batches, in input order
+            while True:
+                batch = list(islice(records, args.batch_size))
+                if not batch:
+                    break
+                texts_per_record = [io_format.texts(record) for record in batch]
+                texts = [text for texts in texts_per_record for text in texts]
+                cleaned = iter(pool.map(texts))
+                for record, record_texts in zip(batch, texts_per_record):
+                    io_format.write(record, list(islice(cleaned, len(record_texts))))
+                n_texts += len(texts)
+                n_chars += sum(map(len, texts))
+    return n_texts, n_chars
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    start = time.perf_counter()
+    try:
+        n_texts, n_chars = run(args)
+    except (OSError, ValueError, TypeError, re.error) as e:
+        print(f"cleantext: error: {e}", file=sys.stderr)
+        return 1
+    elapsed = max(time.perf_counter() - start, 1e-9)
+    if not args.quiet:
+        print(
+            f"cleaned {n_texts:,} texts ({n_chars / 1e6:.1f}M characters) in {elapsed:.2f}s: "
+            f"{n_texts / elapsed:,.0f} texts/s, {n_chars / 1e6 / elapsed:.2f}M characters/s",
+            file=sys.stderr,
+        )
+    return 0
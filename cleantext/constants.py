@@ -2,9 +2,15 @@
 Constant symbols and compiled RegExs use for cleaning.
 """
 
+import json
+import os
 import re
 import sys
+import tempfile
 import unicodedata
+from functools import cache, lru_cache
+
+import emoji
 
 CURRENCIES = {
     "$": "USD",
@@ -25,19 +31,164 @@ CURRENCIES = {
 }
 CURRENCY_REGEX = re.compile("({})+".format("|".join(re.escape(c) for c in CURRENCIES.keys())))
 
-PUNCT_TRANSLATE_UNICODE = dict.fromkeys(
-    (i for i in range(sys.maxunicode) if unicodedata.category(chr(i)).startswith("P")),
-    "",
-)
+# set to a directory to persist the (expensive) scan of all Unicode code points for punctuation
+CACHE_DIR_ENV = "CLEANTEXT_CACHE_DIR"
+
+
+def _scan_punct_codepoints():
+    return [i for i in range(sys.maxunicode) if unicodedata.category(chr(i)).startswith("P")]
+
+
+@cache
+def punct_codepoints():
+    """
+    Return the code points of all Unicode punctuation characters (categories ``P*``).
+    Scanning the whole code space is slow, so the result is computed on first use only
+    and, if the environment variable ``CLEANTEXT_CACHE_DIR`` is set, stored in that directory
+    keyed by the ``unicodedata`` version to make later cold starts cheap.
+    """
+    cache_dir = os.environ.get(CACHE_DIR_ENV)
+    if not cache_dir:
+        return tuple(_scan_punct_codepoints())
+
+    path = os.path.join(cache_dir, f"punct-{unicodedata.unidata_version}.json")
+    try:
+        with open(path, encoding="utf-8") as f:
+            codepoints = json.load(f)
+        if isinstance(codepoints, list) and all(isinstance(i, int) for i in codepoints):
+            return tuple(codepoints)
+    except (OSError, ValueError):
+        pass
+
+    codepoints = _scan_punct_codepoints()
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # write to a temporary file first so concurrent processes never read a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(codepoints, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        # the cache is an optimization only
+        pass
+    return tuple(codepoints)
+
+
+@lru_cache(maxsize=32)
+def punct_translate_table(replace_with=""):
+    """
+    Return a ``str.translate`` table mapping all Unicode punctuation to ``replace_with``.
+    Tables are cached per replacement string.
+    """
+    return dict.fromkeys(punct_codepoints(), replace_with)
+
+
+def _char_class(chars):
+    """Return a regex character class for ``chars``, with runs of code points as ranges (much faster to match)."""
+    ranges = []
+    for code in sorted(map(ord, chars)):
+        if ranges and ranges[-1][1] == code - 1:
+            ranges[-1][1] = code
+        else:
+            ranges.append([code, code])
+    return "[" + "".join(re.escape(chr(a)) + ("" if a == b else "-" + re.escape(chr(b))) for a, b in ranges) + "]"
+
+
+def _trie_pattern(node):
+    """
+    Turn a trie of characters (nested dicts, ``""`` marks the end of a word) into a
+    regex pattern that matches the longest word. The branches of every node start
+    with different characters, so matching never has to try more than one of them.
+    """
+    leaves = []
+    branches = []
+    for char, child in sorted(node.items()):
+        if not char:
+            continue
+        if list(child) == [""]:
+            leaves.append(char)
+        else:
+            branches.append(re.escape(char) + _trie_pattern(child))
+    if len(leaves) == 1:
+        branches.append(re.escape(leaves[0]))
+    elif leaves:
+        branches.append(_char_class(leaves))
+    pattern = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if "" in node:
+        pattern = "(?:" + pattern + ")?"
+    return pattern
+
+
+@cache
+def emoji_regex():
+    """
+    Return a regex matching emoji (longest first), including sequences of emoji
+    joined with zero-width joiners. It's compiled from a trie of all emoji in
+    ``emoji.EMOJI_DATA`` on first use. All emoji are non-ASCII.
+    """
+    trie = {}
+    for word in emoji.EMOJI_DATA:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    # the lookahead rules out most positions before trying the branches of the trie
+    single = f"(?={_char_class(trie)}){_trie_pattern(trie)}"
+    return re.compile(f"{single}(?:\u200d{single})*")
+
+
+@cache
+def emoji_removal_regex():
+    """
+    Return a regex matching what ``remove_emoji`` removes, like ``emoji.replace_emoji``:
+    emoji with a zero-width joiner right after them, and variation selectors
+    anywhere (e.g. after an emoji that is only in the list without one).
+    """
+    return re.compile(f"(?:{emoji_regex().pattern})\u200d?|[\ufe0e\ufe0f]")
+
+
+def __getattr__(name):
+    # build `PUNCT_TRANSLATE_UNICODE` lazily, it's only needed for removing punctuation
+    if name == "PUNCT_TRANSLATE_UNICODE":
+        table = punct_translate_table("")
+        globals()[name] = table
+        return table
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 ACRONYM_REGEX = re.compile(
     r"(?:^|(?<=\W))(?:(?:(?:(?:[A-Z]\.?)+[a-z0-9&/-]?)+(?:[A-Z][s.]?|[0-9]s?))|(?:[0-9](?:\-?[A-Z])+))(?:$|(?=\W))",
     flags=re.UNICODE,
 )
 
-# taken hostname, domainname, tld from URL regex below
+# Host names of the URL and email regexes. The label length (63 characters, RFC 1035), the
+# number of labels and the lengths of the other unbounded parts of those regexes are capped,
+# so a failed match attempt backtracks over a bounded stretch of text and the regexes run in
+# linear time on any input. The cap of a label is checked with a lookahead before matching it.
+# NB: in the raw string, `\\u00a1-\\uffff` is a backslash and the range from "1" to "\\" (with
+# ":", "@" and the upper case letters), not the non-ASCII range it was once meant to be. It's
+# kept as it is to not change what's matched.
+# A host name only matches if a dot and two characters of a TLD follow within 253 characters
+# (the longest host name). This check is cheap and stops runs of labels without a TLD, such as
+# `-www.a-www.a...`, from being matched label by label up to the cap from every `www.`.
+_HOST_LABEL = r"(?=[a-z\\u00a1-\\uffff0-9-]{1,63}\.)[a-z\\u00a1-\\uffff0-9]+(?:-[a-z\\u00a1-\\uffff0-9]+)*"
+_HOST_NAME = (
+    r"(?=[a-z\\u00a1-\\uffff0-9.-]{0,253}\.[a-z\\u00a1-\\uffff]{2})"
+    + _HOST_LABEL
+    + r"(?:\."
+    + _HOST_LABEL
+    + r"){0,126}\.[a-z\\u00a1-\\uffff]{2,}"
+)
+
 EMAIL_REGEX = re.compile(
-    r"(?:^|(?<=[^\w@.)]))([\w+-](\.(?!\.))?)*?[\w+-](@|[(<{\[]at[)>}\]])(?:(?:[a-z\\u00a1-\\uffff0-9]-?)*[a-z\\u00a1-\\uffff0-9]+)(?:\.(?:[a-z\\u00a1-\\uffff0-9]-?)*[a-z\\u00a1-\\uffff0-9]+)*(?:\.(?:[a-z\\u00a1-\\uffff]{2,}))",
+    r"(?:^|(?<=[^\w@.)]))"
+    # local part, at most 64 characters (RFC 5321) without leading, trailing or double dots
+    r"(?=[\w+.-]{1,64}(?:@|[(<{\[]at[)>}\]]))[\w+-](?:\.?[\w+-])*"
+    r"(?:@|[(<{\[]at[)>}\]])" + _HOST_NAME,
     flags=re.IGNORECASE | re.UNICODE,
 )
 
@@ -112,11 +263,21 @@ NUMBERS_REGEX = re.compile(
     r"((?<=[a-zA-Z])\d+)|(\d+(?=[a-zA-Z]))|(?:^|(?<=[^\w,.]))[+–-]?(([1-9]\d{0,2}(,\d{3})+(\.\d*)?)|([1-9]\d{0,2}([ .]\d{3})+(,\d*)?)|(\d*?[.,]\d+)|\d+)(?:$|(?=\b))"
 )
 
+DIGITS_REGEX = re.compile(r"\d")
+
+# the only ASCII characters `fix_bad_unicode` may change: control characters (except tab,
+# line feed and form feed), backslash escapes and HTML entities
+ASCII_FIX_UNICODE_REGEX = re.compile(r"[\x00-\x08\x0b\x0d-\x1f\x7f&\\]")
+
 LINEBREAK_REGEX = re.compile(r"((\r\n)|[\n\v])+")
 TWO_LINEBREAK_REGEX = re.compile(r"((\r\n)|[\n\v])+((\r\n)|[\n\v])+")
 MULTI_WHITESPACE_TO_ONE_REGEX = re.compile(r"\s+")
 NONBREAKING_SPACE_REGEX = re.compile(r"(?!\n)\s+")
 
+# cheap prechecks: a URL needs a protocol (`://`) or `www`, an email `@` or `(at)` & co.
+WWW_REGEX = re.compile(r"www", flags=re.IGNORECASE)
+AT_REGEX = re.compile(r"[(<{\[]at[)>}\]]", flags=re.IGNORECASE)
+
 # source: https://gist.github.com/dperini/729294
 # @jfilter: I guess it was changed
 URL_REGEX = re.compile(
@@ -124,8 +285,8 @@ URL_REGEX = re.compile(
     # protocol identifier
     # r"(?:(?:https?|ftp)://)"  <-- alt?
     r"(?:(?:https?:\/\/|ftp:\/\/|www\d{0,3}\.))"
-    # user:pass authentication
-    r"(?:\S+(?::\S*)?@)?"
+    # user:pass authentication, at most 256 characters
+    r"(?:\S{1,256}@)?"
     r"(?:"
     # IP address exclusion
     # private & local networks
@@ -141,13 +302,8 @@ URL_REGEX = re.compile(
     r"(?:\.(?:1?\d{1,2}|2[0-4]\d|25[0-5])){2}"
     r"(?:\.(?:[1-9]\d?|1\d\d|2[0-4]\d|25[0-4]))"
     r"|"
-    # host name
-    r"(?:(?:[a-z\\u00a1-\\uffff0-9]-?)*[a-z\\u00a1-\\uffff0-9]+)"
-    # domain name
-    r"(?:\.(?:[a-z\\u00a1-\\uffff0-9]-?)*[a-z\\u00a1-\\uffff0-9]+)*"
-    # TLD identifier
-    r"(?:\.(?:[a-z\\u00a1-\\uffff]{2,}))"
-    r"|"
+    # host name, domain name and TLD identifier
+    rf"{_HOST_NAME}|"
     r"(?:(localhost))"
     r")"
     # port number
@@ -184,8 +340,9 @@ strange_single_quotes = ["‘", "‛", "’", "❛", "❜", "`", "´", "‘", "
 DOUBLE_QUOTE_REGEX = re.compile("|".join(strange_double_quotes))
 SINGLE_QUOTE_REGEX = re.compile("|".join(strange_single_quotes))
 
+# fences are capped at 64 backticks, so runs of backticks don't take quadratic time
 CODE_REGEX = re.compile(
-    r"(`{3,})\w*\n[\s\S]*?\1"  # fenced code blocks (```lang\n...\n```)
+    r"(?P<fence>`{3,64})\w*\n[\s\S]*?(?P=fence)"  # fenced code blocks (```lang\n...\n```)
     r"|"
     r"`[^`\n]+`",  # inline code (`...`)
 )
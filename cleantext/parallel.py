@@ -0,0 +1,399 @@
+"""
+Process pools for cleaning many texts in parallel.
+"""
+
+import os
+import sys
+from array import array
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import accumulate, chain, islice
+from multiprocessing import Pool, resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+from .clean import Cleaner, _resolve_n_jobs
+from .profiler import Profiler
+
+# set once per worker process by `_init_worker`, so tasks only carry texts
+_worker_cleaner = None
+
+
+def _init_worker(cleaner):
+    global _worker_cleaner
+    _worker_cleaner = cleaner
+
+
+def _clean_chunk(texts):
+    return _worker_cleaner.map(texts)
+
+
+def _map_profiled(cleaner, settings, texts):
+    """
+    Clean ``texts`` into a fresh ``Profiler(*settings)`` and return the results with
+    it, to be merged by the caller.
+    """
+    profiler = Profiler(*settings)
+    return cleaner.map(texts, profiler), profiler
+
+
+def _clean_chunk_profiled(settings, texts):
+    return _map_profiled(_worker_cleaner, settings, texts)
+
+
+def _merge_profiles(results, profiler, indices):
+    """
+    Merge the profilers of :func:`_map_profiled` results into ``profiler`` and return
+    the cleaned chunks. ``indices`` holds the positions in the batch of each chunk's texts.
+    """
+    chunks = []
+    for (cleaned, chunk_profiler), chunk in zip(results, indices):
+        profiler.merge(chunk_profiler, chunk)
+        chunks.append(cleaned)
+    return chunks
+
+
+def _attach(name):
+    # since Python 3.13, attaching processes need not register the segment with the resource
+    # tracker. Only for workers: the process that unlinks a segment must track it, or the
+    # tracker keeps the registration of the creator and "cleans up" the segment at shutdown
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name, track=False)
+    return SharedMemory(name)
+
+
+def _pack(chunks):
+    """
+    Encode the lists of texts ``chunks`` into one buffer: the cumulative character
+    offsets of all texts (int64, starting with 0) followed by the texts as UTF-8.
+    Returns the buffer as a shared memory segment and the ``(start, end)`` byte
+    range of each chunk in the UTF-8 part.
+    """
+    offsets = array("q", accumulate(map(len, chain.from_iterable(chunks)), initial=0))
+    header = offsets.tobytes()
+    # lone surrogates can't be encoded otherwise
+    blobs = ["".join(chunk).encode("utf-8", "surrogatepass") for chunk in chunks]
+    segment = SharedMemory(create=True, size=max(1, len(header) + sum(map(len, blobs))))
+    segment.buf[: len(header)] = header
+    ranges = []
+    position = len(header)
+    for blob in blobs:
+        segment.buf[position : position + len(blob)] = blob
+        ranges.append((position, position + len(blob)))
+        position += len(blob)
+    return segment, ranges
+
+
+def _unpack(buf, first, last, start, end):
+    """Return the texts ``first`` to ``last`` (exclusive) of a buffer of :func:`_pack`, encoded at ``start:end``."""
+    offsets = array("q")
+    offsets.frombytes(buf[first * 8 : (last + 1) * 8])
+    text = str(buf[start:end], "utf-8", "surrogatepass")
+    if offsets[0]:
+        offsets = array("q", (offset - offsets[0] for offset in offsets))
+    return list(map(text.__getitem__, map(slice, offsets, islice(offsets, 1, None))))
+
+
+def _clean_shared_chunk(name, first, last, start, end, profiler_settings=None):
+    segment = _attach(name)
+    try:
+        texts = _unpack(segment.buf, first, last, start, end)
+    finally:
+        segment.close()
+    profiler = None if profiler_settings is None else Profiler(*profiler_settings)
+    output, ranges = _pack([_worker_cleaner.map(texts, profiler)])
+    name = output.name
+    output.close()
+    return name, len(texts), ranges[0], profiler
+
+
+def _chunks(texts, chunksize):
+    return [texts[i : i + chunksize] for i in range(0, len(texts), chunksize)]
+
+
+def _balanced_chunks(texts, n_chunks):
+    """
+    Group the indices of ``texts`` into about ``n_chunks`` chunks of similar total length.
+
+    Indices are taken longest text first, so huge documents end up in their own
+    chunks at the front of the list and are dispatched before the small ones.
+    """
+    lengths = [len(t) if isinstance(t, str) else 0 for t in texts]
+    budget = max(1, sum(lengths) // n_chunks)
+    chunks = []
+    current = []
+    size = 0
+    for i in sorted(range(len(texts)), key=lengths.__getitem__, reverse=True):
+        current.append(i)
+        size += lengths[i]
+        if size >= budget:
+            chunks.append(current)
+            current = []
+            size = 0
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _scatter(indices, cleaned_chunks, n_texts):
+    """Put the cleaned texts of the chunks of :func:`_balanced_chunks` back into input order."""
+    results = [None] * n_texts
+    for chunk, cleaned in zip(indices, cleaned_chunks):
+        for i, text in zip(chunk, cleaned):
+            results[i] = text
+    return results
+
+
+def _executor_class(executor):
+    if executor == "thread":
+        return ThreadPoolExecutor
+    if executor == "interpreter":
+        try:
+            from concurrent.futures import InterpreterPoolExecutor
+        except ImportError:
+            raise ValueError("executor='interpreter' needs concurrent.futures.InterpreterPoolExecutor (Python 3.14+)")
+        return InterpreterPoolExecutor
+    raise ValueError(f"executor must be 'process', 'thread' or 'interpreter', got {executor!r}")
+
+
+def _executor_map(cleaner, texts, n_jobs, executor, profiler=None):
+    """
+    Clean the list ``texts`` with ``n_jobs`` threads or sub-interpreters, see :func:`clean_texts`.
+    Threads share the compiled cleaner and need no pickling, which scales on free-threaded builds.
+    """
+    indices = _balanced_chunks(texts, n_jobs * 4)
+    chunks = [[texts[i] for i in chunk] for chunk in indices]
+    with _executor_class(executor)(max_workers=n_jobs) as pool:
+        if profiler is None:
+            return _scatter(indices, pool.map(cleaner.map, chunks), len(texts))
+        results = pool.map(partial(_map_profiled, cleaner, profiler._settings()), chunks)
+        return _scatter(indices, _merge_profiles(results, profiler, indices), len(texts))
+
+
+def _contiguous_chunks(texts, n_chunks):
+    """Split ``texts`` into at most ``n_chunks`` consecutive ranges ``(first, last)`` of similar total length."""
+    ends = list(accumulate(map(len, texts)))
+    total = ends[-1] if ends else 0
+    bounds = [0]
+    for k in range(1, n_chunks):
+        # the first text that reaches the k-th share of the total length closes a chunk
+        bound = bisect_left(ends, total * k / n_chunks) + 1
+        if bounds[-1] < bound < len(texts):
+            bounds.append(bound)
+    bounds.append(len(texts))
+    return list(zip(bounds, bounds[1:]))
+
+
+def _iter_chunks(texts, chunksize):
+    texts = iter(texts)
+    while True:
+        chunk = list(islice(texts, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+class CleaningPool:
+    """
+    A pool of warm worker processes that clean texts with a fixed configuration.
+
+    Creating processes and importing ``cleantext`` in them is expensive, so keep
+    one pool around and reuse it for many batches instead of calling
+    :func:`clean_texts` with ``n_jobs`` over and over. The configuration is sent
+    to every worker once when it starts; tasks only carry the texts. The pool
+    may be shared by several threads.
+
+    Args:
+        n_jobs: number of worker processes, see :func:`clean_texts`.
+            With ``1`` (or ``None``) texts are cleaned in the calling process.
+        cleaner (Cleaner): the configuration to use. Alternatively, pass the
+            keyword arguments of :func:`clean` directly.
+
+    Example:
+        >>> with CleaningPool(n_jobs=4, no_urls=True) as pool:
+        ...     for batch in batches:
+        ...         cleaned = pool.map(batch)
+    """
+
+    def __init__(self, n_jobs=-1, cleaner=None, **kwargs):
+        if cleaner is not None and kwargs:
+            raise TypeError("Pass either a Cleaner or keyword arguments for clean, not both")
+        self.cleaner = cleaner if cleaner is not None else Cleaner(**kwargs)
+        self.n_jobs = _resolve_n_jobs(n_jobs)
+        self._pool = None
+        self._closed = False
+        if self.n_jobs > 1:
+            if os.name == "posix":
+                # the transport is only chosen per batch, so workers must share the parent's
+                # tracker of shared memory segments from the start, otherwise each starts its
+                # own that "cleans up" segments the parent still owns (POSIX only, Windows
+                # frees segments when their last handle is closed)
+                resource_tracker.ensure_running()
+            self._pool = Pool(processes=self.n_jobs, initializer=_init_worker, initargs=(self.cleaner,))
+
+    def map(self, texts, chunksize=None, transport="pickle", profiler=None):
+        """
+        Clean all ``texts`` and return a list of the results in the same order.
+
+        Args:
+            texts: iterable of strings to clean.
+            chunksize: number of texts sent to a worker per task. By default,
+                texts are grouped into about four chunks per worker of similar
+                total length and the longest texts are dispatched first.
+            transport: how texts get to the workers and back. ``"pickle"``
+                sends them with each task; ``"shared_memory"`` packs them into
+                one shared memory buffer per batch and per task result, which
+                saves the pickling of every single string. Outside of POSIX
+                systems, texts are always pickled: there, a segment is gone
+                once the worker that wrote the results closes it.
+            profiler: a :class:`Profiler` to record the time taken by each
+                step into. Every task is profiled in its worker and the results
+                are merged.
+        """
+        if self._closed:
+            raise ValueError("CleaningPool is closed")
+        if transport not in ("pickle", "shared_memory"):
+            raise ValueError(f"transport must be 'pickle' or 'shared_memory', got {transport!r}")
+        texts = list(texts)
+        if self._pool is None or len(texts) == 0:
+            return self.cleaner.map(texts, profiler)
+        if transport == "shared_memory" and os.name == "posix":
+            return self._map_shared(texts, chunksize, profiler)
+
+        if chunksize is not None:
+            chunks = _chunks(texts, chunksize)
+            indices = [range(i, i + len(chunk)) for i, chunk in zip(range(0, len(texts), chunksize), chunks)]
+            return [text for chunk in self._map_chunks(chunks, indices, profiler) for text in chunk]
+
+        # a few chunks per worker balances the load without paying IPC per text
+        indices = _balanced_chunks(texts, self.n_jobs * 4)
+        chunks = [[texts[i] for i in chunk] for chunk in indices]
+        # chunksize=1 hands out the chunks in order, i.e., the longest texts first
+        return _scatter(indices, self._map_chunks(chunks, indices, profiler, chunksize=1), len(texts))
+
+    def _map_chunks(self, chunks, indices, profiler, chunksize=None):
+        if profiler is None:
+            return self._pool.map(_clean_chunk, chunks, chunksize=chunksize)
+        results = self._pool.map(partial(_clean_chunk_profiled, profiler._settings()), chunks, chunksize=chunksize)
+        return _merge_profiles(results, profiler, indices)
+
+    def _map_shared(self, texts, chunksize, profiler=None):
+        # what the cleaner would do with other objects anyway
+        texts = ["" if text is None else str(text) for text in texts]
+        if chunksize is None:
+            chunks = _contiguous_chunks(texts, self.n_jobs * 4)
+        else:
+            chunks = [(i, min(i + chunksize, len(texts))) for i in range(0, len(texts), chunksize)]
+        segment, ranges = _pack([texts[first:last] for first, last in chunks])
+        try:
+            settings = None if profiler is None else profiler._settings()
+            pending = [
+                self._pool.apply_async(_clean_shared_chunk, (segment.name, first, last, start, end, settings))
+                for (first, last), (start, end) in zip(chunks, ranges)
+            ]
+            results = []
+            error = None
+            for (first, last), result in zip(chunks, pending):
+                try:
+                    name, n_texts, (start, end), chunk_profiler = result.get()
+                except Exception as e:
+                    error = error or e
+                    continue
+                # collect every output segment, even after an error, to unlink them
+                output = SharedMemory(name)
+                try:
+                    if error is None:
+                        results.extend(_unpack(output.buf, 0, n_texts, start, end))
+                        if chunk_profiler is not None:
+                            profiler.merge(chunk_profiler, range(first, last))
+                finally:
+                    output.close()
+                    output.unlink()
+            if error is not None:
+                raise error
+            return results
+        finally:
+            segment.close()
+            segment.unlink()
+
+    def imap(self, texts, chunksize=256, max_in_flight=None):
+        """
+        Lazily clean the iterable ``texts`` and yield the results in input order.
+
+        Input is consumed in chunks of ``chunksize`` texts and at most
+        ``max_in_flight`` chunks (default: two per worker) are queued or being
+        cleaned at any time, so memory stays bounded for arbitrarily large inputs.
+        """
+        if self._closed:
+            raise ValueError("CleaningPool is closed")
+        if chunksize < 1:
+            raise ValueError("chunksize must be at least 1")
+        if self._pool is None:
+            for text in texts:
+                yield self.cleaner(text)
+            return
+
+        if max_in_flight is None:
+            max_in_flight = 2 * self.n_jobs
+        # `Pool.imap` reads its whole input eagerly, so we keep our own window of pending chunks
+        window = deque()
+        for chunk in _iter_chunks(texts, chunksize):
+            window.append(self._pool.apply_async(_clean_chunk, (chunk,)))
+            if len(window) >= max_in_flight:
+                yield from window.popleft().get()
+        while window:
+            yield from window.popleft().get()
+
+    def close(self):
+        """Wait for outstanding work and stop the worker processes."""
+        self._closed = True
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def terminate(self):
+        """Stop the worker processes immediately without finishing outstanding work."""
+        self._closed = True
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.terminate()
+
+
+def iter_clean_texts(texts, n_jobs=1, *, chunksize=256, max_in_flight=None, pool=None, **kwargs):
+    """Lazily clean an iterable of texts, optionally in parallel.
+
+    Unlike :func:`clean_texts`, neither the input nor the output is held in
+    memory as a whole, which makes this suitable for corpora of any size.
+
+    Args:
+        texts: iterable of strings to clean, consumed lazily.
+        n_jobs: number of parallel workers, see :func:`clean_texts`.
+        chunksize: number of texts sent to a worker per task.
+        max_in_flight: maximum number of chunks queued or being cleaned at a time,
+            defaults to two per worker.
+        pool (CleaningPool): reuse the workers of this pool, ``n_jobs`` is ignored.
+        **kwargs: keyword arguments for :func:`clean`.
+
+    Yields:
+        str: cleaned texts in the same order as *texts*.
+    """
+    if pool is not None:
+        if kwargs and Cleaner(**kwargs) != pool.cleaner:
+            raise ValueError("The cleaning options differ from the configuration of the given pool")
+        yield from pool.imap(texts, chunksize=chunksize, max_in_flight=max_in_flight)
+        return
+
+    with CleaningPool(n_jobs=n_jobs, **kwargs) as own_pool:
+        yield from own_pool.imap(texts, chunksize=chunksize, max_in_flight=max_in_flight)
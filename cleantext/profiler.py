@@ -0,0 +1,236 @@
+"""
+Per-stage timing of the cleaning pipeline.
+"""
+
+import heapq
+import math
+from collections import Counter
+from threading import Lock
+
+# histogram buckets per doubling of the time, i.e. percentiles are accurate to about 9%
+_BUCKETS_PER_OCTAVE = 8
+# lower bound of the first bucket, in seconds
+_MIN_TIME = 1e-7
+
+
+def _bucket(seconds):
+    if seconds <= _MIN_TIME:
+        return 0
+    return int(math.log2(seconds / _MIN_TIME) * _BUCKETS_PER_OCTAVE)
+
+
+def _bucket_time(bucket):
+    """Geometric middle of a histogram bucket."""
+    return _MIN_TIME * 2 ** ((bucket + 0.5) / _BUCKETS_PER_OCTAVE)
+
+
+class _StageStats:
+    __slots__ = ("calls", "total", "max", "chars_in", "chars_out", "histogram")
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.chars_in = 0
+        self.chars_out = 0
+        # bucket -> number of calls
+        self.histogram = Counter()
+
+    def add(self, seconds, chars_in, chars_out):
+        self.calls += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.chars_in += chars_in
+        self.chars_out += chars_out
+        self.histogram[_bucket(seconds)] += 1
+
+    def merge(self, other):
+        self.calls += other.calls
+        self.total += other.total
+        self.max = max(self.max, other.max)
+        self.chars_in += other.chars_in
+        self.chars_out += other.chars_out
+        self.histogram.update(other.histogram)
+
+    def percentile(self, q):
+        if not self.calls:
+            return 0.0
+        rank = q / 100 * self.calls
+        seen = 0
+        for bucket in sorted(self.histogram):
+            seen += self.histogram[bucket]
+            if seen >= rank:
+                return min(_bucket_time(bucket), self.max)
+        return self.max
+
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+
+
+class Profiler:
+    """
+    Accumulates how long each step of the cleaning pipeline takes.
+
+    Pass it as ``profiler`` to :func:`clean`, :func:`clean_texts` or
+    :meth:`Cleaner.map`. For every step that runs on a text, the call count,
+    total time, a histogram of the times and the characters going in and out are
+    recorded; steps skipped by their precheck are not. The stages are named like
+    the arguments enabling them (``"no_urls"``), plus ``"protect_exceptions"``
+    and ``"restore_exceptions"`` for ``exceptions`` and ``"total"`` for the
+    whole pipeline per text. With ``n_jobs``, every worker profiles its share of the texts and
+    the results are merged into this profiler. One profiler may be shared by
+    several configurations and threads.
+
+    Profiling costs two ``time.perf_counter()`` calls per step and text; without
+    a profiler, nothing is measured.
+
+    With ``slowest=N``, the profiler also keeps the ``N`` texts that took the
+    longest, see :meth:`slowest_texts`, to reproduce the pathological inputs of
+    a batch without profiling all of it again.
+
+    Args:
+        slowest (int): number of slowest texts to keep, 0 to keep none.
+        sample_length (int): number of characters of each slow text to keep.
+
+    Example:
+        >>> profiler = Profiler(slowest=5)
+        >>> cleaned = clean_texts(posts, n_jobs=4, no_urls=True, profiler=profiler)
+        >>> print(profiler.report())  # a table of all stages
+        >>> profiler.stats()["no_urls"]["p99"]  # seconds
+        4.2e-05
+        >>> profiler.slowest_texts()[0]["index"]  # position in posts
+        8121
+    """
+
+    def __init__(self, slowest=0, sample_length=200):
+        if slowest < 0 or sample_length < 0:
+            raise ValueError("slowest and sample_length must not be negative")
+        self.slowest = slowest
+        self.sample_length = sample_length
+        # stage name -> _StageStats, in the order the stages were first seen
+        self._stages = {}
+        # min-heap of (total seconds, sequence number, record) of the slowest texts
+        self._slow = []
+        self._seen = 0
+        self._lock = Lock()
+
+    def __getstate__(self):
+        return {name: value for name, value in self.__dict__.items() if name != "_lock"}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    def _settings(self):
+        """Arguments for an empty profiler like this one, e.g. for a worker process."""
+        return self.slowest, self.sample_length
+
+    def reset(self):
+        """Forget everything recorded so far."""
+        with self._lock:
+            self._stages = {}
+            self._slow = []
+            self._seen = 0
+
+    def _record(self, timings, text=None, index=None):
+        """
+        Add the ``(stage, seconds, chars in, chars out)`` tuples of one text, the last
+        of them for ``"total"``. ``text`` is the input at position ``index`` of its batch.
+        """
+        with self._lock:
+            for name, seconds, chars_in, chars_out in timings:
+                stats = self._stages.get(name)
+                if stats is None:
+                    stats = self._stages[name] = _StageStats()
+                stats.add(seconds, chars_in, chars_out)
+            if self.slowest:
+                total = timings[-1][1]
+                if len(self._slow) < self.slowest or total > self._slow[0][0]:
+                    record = {
+                        "index": index,
+                        "length": timings[-1][2],
+                        "total": total,
+                        "stages": {name: seconds for name, seconds, _, _ in timings[:-1]},
+                        "sample": text[: self.sample_length] if text is not None else None,
+                    }
+                    self._push_slow(total, record)
+
+    def _push_slow(self, total, record):
+        self._seen += 1
+        item = (total, self._seen, record)
+        if len(self._slow) < self.slowest:
+            heapq.heappush(self._slow, item)
+        elif total > self._slow[0][0]:
+            heapq.heapreplace(self._slow, item)
+
+    def merge(self, other, indices=None):
+        """
+        Add everything recorded by the profiler ``other``, e.g. in another process.
+
+        ``indices`` maps the positions in the batch profiled by ``other`` to the
+        positions in the batch of this profiler, e.g. for a chunk of a batch.
+        """
+        with self._lock:
+            for name, other_stats in other._stages.items():
+                stats = self._stages.get(name)
+                if stats is None:
+                    stats = self._stages[name] = _StageStats()
+                stats.merge(other_stats)
+            if self.slowest:
+                for total, _, record in other._slow:
+                    if indices is not None and record["index"] is not None:
+                        record = dict(record, index=indices[record["index"]])
+                    self._push_slow(total, record)
+
+    def slowest_texts(self):
+        """
+        Return the slowest texts, slowest first, as dicts with the ``"index"`` of the
+        text in its batch (``None`` for :func:`clean`), its ``"length"`` in characters,
+        the ``"total"`` seconds, the seconds of each step that ran (``"stages"``) and
+        the first ``sample_length`` characters of the input (``"sample"``).
+        Needs ``slowest`` to be set.
+        """
+        with self._lock:
+            return [dict(record, stages=dict(record["stages"])) for _, _, record in sorted(self._slow, reverse=True)]
+
+    def stats(self):
+        """
+        Return ``{stage: {"calls", "total", "mean", "p50", "p90", "p99", "max",
+        "chars_in", "chars_out"}}`` with times in seconds. Percentiles are
+        estimated from a histogram with a resolution of about 9%.
+        """
+        with self._lock:
+            return {
+                name: {
+                    "calls": stats.calls,
+                    "total": stats.total,
+                    "mean": stats.total / stats.calls if stats.calls else 0.0,
+                    "p50": stats.percentile(50),
+                    "p90": stats.percentile(90),
+                    "p99": stats.percentile(99),
+                    "max": stats.max,
+                    "chars_in": stats.chars_in,
+                    "chars_out": stats.chars_out,
+                }
+                for name, stats in self._stages.items()
+            }
+
+    def report(self):
+        """Return the :meth:`stats` as a table, the slowest stages in total first."""
+        stats = self.stats()
+        lines = [
+            f"{'stage':20s} {'calls':>9s} {'total (s)':>10s} {'mean (µs)':>10s} {'p50 (µs)':>10s} "
+            f"{'p90 (µs)':>10s} {'p99 (µs)':>10s} {'max (µs)':>10s} {'chars in':>12s} {'chars out':>12s}"
+        ]
+        for name, s in sorted(stats.items(), key=lambda item: (item[0] != "total", -item[1]["total"])):
+            lines.append(
+                f"{name:20s} {s['calls']:9,d} {s['total']:10.3f} {s['mean'] * 1e6:10.1f} {s['p50'] * 1e6:10.1f} "
+                f"{s['p90'] * 1e6:10.1f} {s['p99'] * 1e6:10.1f} {s['max'] * 1e6:10.1f} "
+                f"{s['chars_in']:12,d} {s['chars_out']:12,d}"
+            )
+        return "\n".join(lines)
@@ -5,9 +5,12 @@ Pipeline transformer for scikit-learn to clean text
 from typing import Any, Union
 
 import pandas as pd
+from joblib import effective_n_jobs
 from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.utils.parallel import Parallel, delayed
 
-from .clean import clean
+from .clean import _get_cleaner, _resolve_n_jobs
+from .parallel import _balanced_chunks, _scatter
 
 
 class CleanTransformer(TransformerMixin, BaseEstimator):
@@ -47,9 +50,17 @@ class CleanTransformer(TransformerMixin, BaseEstimator):
         replace_with_punct="",
         lang="en",
         exceptions=None,
+        fuse_entities=False,
+        n_jobs=None,
     ):
         """
-        All parameters are same as the :term:`clean` function.
+        All parameters are same as the :term:`clean` function, except for:
+
+        n_jobs: number of parallel workers for :meth:`transform`, same values
+            as for :term:`clean_texts`. The work is run with joblib, so it is
+            not oversubscribed when nested in a parallel scikit-learn estimator
+            such as ``GridSearchCV(n_jobs=...)``. ``None`` (default) means 1
+            unless set otherwise with ``joblib.parallel_config``.
         """
         self.fix_unicode = fix_unicode
         self.to_ascii = to_ascii
@@ -81,6 +92,8 @@ class CleanTransformer(TransformerMixin, BaseEstimator):
         self.replace_with_punct = replace_with_punct
         self.lang = lang
         self.exceptions = exceptions
+        self.fuse_entities = fuse_entities
+        self.n_jobs = n_jobs
 
     def fit(self, X: Any, y=None):
         """
@@ -106,9 +119,28 @@ class CleanTransformer(TransformerMixin, BaseEstimator):
         if not (isinstance(X, list) or isinstance(X, pd.Series)):
             raise ValueError("The input must be a list or pd.Series")
         if isinstance(X, pd.Series):
-            return X.apply(lambda text: clean(text, **self.get_params()))
+            if X.empty:
+                return X.copy()
+            return pd.Series(self._clean(X.tolist()), index=X.index, name=X.name)
         else:
-            return list(map(lambda text: clean(text, **self.get_params()), X))
+            return self._clean(X)
+
+    def _clean(self, texts):
+        # resolve the parameters once, not per row
+        params = self.get_params()
+        n_jobs = params.pop("n_jobs")
+        # joblib takes None from `parallel_config`, an explicit number overrides it
+        n_workers = min(effective_n_jobs(None) if n_jobs is None else _resolve_n_jobs(n_jobs), len(texts))
+        params["exceptions"] = tuple(params["exceptions"]) if params["exceptions"] else None
+        cleaner = _get_cleaner(**params)
+        if n_workers <= 1:
+            return cleaner.map(texts)
+
+        # a few chunks per worker of similar total length, longest texts first
+        indices = _balanced_chunks(texts, n_workers * 4)
+        parallel = Parallel(n_jobs=None if n_jobs is None else n_workers)
+        chunks = parallel(delayed(cleaner.map)([texts[i] for i in chunk]) for chunk in indices)
+        return _scatter(indices, chunks, len(texts))
 
     def get_feature_names_out(self, feature_names_out=None):
         """
@@ -2,7 +2,10 @@
 Language-specific edge case handling.
 """
 
+import re
 import unicodedata
+import warnings
+from functools import cache
 
 # add new languages here
 specials_map = {
@@ -114,7 +117,18 @@ specials_map = {
         "case_sensitive": [],
     },
 }
-escape_sequence = "xxxxx"
+
+
+_ESCAPE_SEQUENCE = "xxxxx"
+
+
+def __getattr__(name):
+    if name == "escape_sequence":
+        warnings.warn(
+            "cleantext.specials.escape_sequence is deprecated and will be removed", DeprecationWarning, stacklevel=2
+        )
+        return _ESCAPE_SEQUENCE
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def norm(text):
@@ -122,9 +136,17 @@ def norm(text):
 
 
 def save_replace(text, lang, back=False):
-    # perserve the casing of the original text
-    # TODO: performance of matching
+    """
+    Escape (or with ``back``, unescape) the special characters of ``lang`` in ``text``.
 
+    Deprecated: ``to_ascii_unicode`` keeps special characters with :func:`transliterate`.
+    """
+    warnings.warn(
+        "cleantext.specials.save_replace is deprecated and will be removed, use transliterate instead",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    # perserve the casing of the original text
     # normalize the text to make sure to really match all occurences
     text = norm(text)
 
@@ -135,7 +157,34 @@ def save_replace(text, lang, back=False):
     )
     for pattern, target in possibilities:
         if back:
-            text = text.replace(escape_sequence + target + escape_sequence, pattern)
+            text = text.replace(_ESCAPE_SEQUENCE + target + _ESCAPE_SEQUENCE, pattern)
         else:
-            text = text.replace(pattern, escape_sequence + target + escape_sequence)
+            text = text.replace(pattern, _ESCAPE_SEQUENCE + target + _ESCAPE_SEQUENCE)
     return text
+
+
+@cache
+def specials_regex(lang):
+    """
+    Compile a regex matching runs of characters that need transliteration for ``lang``:
+    everything except ASCII and the special characters of ``lang`` (which are kept).
+    """
+    specials = set()
+    if lang in specials_map:
+        specials.update(norm(x[0]) for x in specials_map[lang]["case_sensitive"])
+        for x in specials_map[lang]["case_insensitive"]:
+            specials.add(norm(x[0]))
+            specials.add(norm(x[0].upper()))
+    return re.compile("[^\\x00-\\x7f" + "".join(re.escape(c) for c in sorted(specials)) + "]+")
+
+
+def transliterate(text, lang, transliterator):
+    """
+    Apply the character-wise ``transliterator`` to ``text`` in a single pass, except
+    for ASCII and the special characters of ``lang`` which are kept as they are
+    (e.g. German umlauts).
+    """
+    if lang in specials_map:
+        # normalize the text to make sure to really match all occurences
+        text = norm(text)
+    return specials_regex(lang).sub(lambda m: transliterator(m.group()), text)
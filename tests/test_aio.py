@@ -0,0 +1,125 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from cleantext import clean, clean_texts
+from cleantext.aio import _cleaner, _limits, aclean, aclean_texts, aiter_clean_texts
+
+texts = [f"Visit https://example.com/{i}  NOW, Grüße!" * (i % 5 + 1) for i in range(100)]
+
+
+def test_aclean():
+    result = asyncio.run(aclean("Hello  World https://example.com", no_urls=True, lower=False))
+    assert result == clean("Hello  World https://example.com", no_urls=True, lower=False)
+
+
+def test_aclean_texts():
+    result = asyncio.run(aclean_texts(texts, chunksize=7, max_in_flight=3, no_urls=True, exceptions=[r"\d+"]))
+    assert result == clean_texts(texts, no_urls=True, exceptions=[r"\d+"])
+
+
+def test_aclean_texts_process_executor():
+    async def main():
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            return await aclean_texts(texts, executor=executor, chunksize=10, no_urls=True)
+
+    assert asyncio.run(main()) == clean_texts(texts, no_urls=True)
+
+
+def test_aiter_clean_texts_async_iterable():
+    async def produce():
+        for text in texts:
+            await asyncio.sleep(0)
+            yield text
+
+    async def main():
+        return [text async for text in aiter_clean_texts(produce(), chunksize=8)]
+
+    assert asyncio.run(main()) == clean_texts(texts)
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """Records the peak number of tasks running at a time, each taking at least ``delay`` seconds."""
+
+    def __init__(self, max_workers, delay=0):
+        super().__init__(max_workers=max_workers)
+        self.delay = delay
+        self.running = 0
+        self.peak = 0
+        self._count_lock = threading.Lock()
+
+    def submit(self, fn, *args):
+        def run():
+            with self._count_lock:
+                self.running += 1
+                self.peak = max(self.peak, self.running)
+            try:
+                time.sleep(self.delay)
+                return fn(*args)
+            finally:
+                with self._count_lock:
+                    self.running -= 1
+
+        return super().submit(run)
+
+
+def test_aiter_clean_texts_caps_in_flight():
+    async def main():
+        with CountingExecutor(max_workers=8) as executor:
+            return await aclean_texts(texts, executor=executor, chunksize=5, max_in_flight=2), executor.peak
+
+    result, peak = asyncio.run(main())
+    assert result == clean_texts(texts)
+    assert 1 <= peak <= 2
+
+
+def test_aclean_caps_in_flight():
+    async def main():
+        with CountingExecutor(max_workers=8, delay=0.01) as executor:
+            results = await asyncio.gather(*(aclean(text, executor=executor, max_in_flight=3) for text in texts[:40]))
+            return results, executor.peak
+
+    results, peak = asyncio.run(main())
+    assert results == clean_texts(texts[:40])
+    assert peak == 3
+    # the semaphores of finished calls are dropped
+    assert _limits == {}
+    with pytest.raises(ValueError):
+        asyncio.run(aclean("a", max_in_flight=0))
+
+
+def test_aclean_texts_cancellation():
+    started = threading.Event()
+    release = threading.Event()
+
+    async def main():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # occupy the only worker so the chunks stay queued
+            executor.submit(lambda: started.set() or release.wait(5))
+            started.wait(5)
+            task = asyncio.ensure_future(aclean_texts(texts, executor=executor, chunksize=10, max_in_flight=4))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            cleaner = _cleaner({})
+            calls = cleaner.calls
+            release.set()
+        # the queued chunks were cancelled instead of being cleaned after the blocker
+        return calls, cleaner.calls
+
+    before, after = asyncio.run(main())
+    assert before == after
+
+
+def test_aiter_clean_texts_validates_arguments():
+    async def main(**kwargs):
+        return [text async for text in aiter_clean_texts(["a"], **kwargs)]
+
+    with pytest.raises(ValueError):
+        asyncio.run(main(chunksize=0))
+    with pytest.raises(ValueError):
+        asyncio.run(main(max_in_flight=0))
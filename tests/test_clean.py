@@ -681,3 +681,1110 @@ def test_exception_clean_transformer_clone():
     ct2 = clone(ct)
     result = ct2.transform(["drive-thru is great"])
     assert "drive-thru" in result[0]
+
+
+def test_exception_many_matches():
+    """Thousands of matches are protected and restored, past any placeholder index."""
+    tags = [f"#Tag_{i}" for i in range(3000)]
+    result = cleantext.clean(" ".join(tags), no_punct=True, lower=False, exceptions=[r"#\w+"])
+    assert result == " ".join(tags)
+
+
+def test_exception_patterns_combined():
+    from cleantext.clean import _compile_exceptions
+
+    assert len(_compile_exceptions([r"\w+-\w+", r"\$\d+"])) == 1
+    # backreferences would point to the wrong group in an alternation
+    assert len(_compile_exceptions([r"(\w)\1", r"\$\d+"])) == 2
+    # duplicate group names cannot be combined
+    assert len(_compile_exceptions([r"(?P<x>a)", r"(?P<x>b)"])) == 2
+    # a global flag would apply to all patterns
+    assert len(_compile_exceptions([r"foo", r"(?i)bar"])) == 2
+    assert len(_compile_exceptions([r"foo", r"(?i:bar)"])) == 1
+
+
+def test_exception_global_flag_stays_with_its_pattern():
+    result = cleantext.clean("FOO-x BAR-y", lower=False, no_punct=True, exceptions=[r"foo-\w", r"(?i)bar-\w"])
+    assert result == "FOOx BAR-y"
+
+
+def test_exception_compiled_patterns():
+    import re
+
+    exceptions = [re.compile(r"foo-\w", re.IGNORECASE), r"\$\d+"]
+    result = cleantext.clean("FOO-x $5 a-b", lower=False, no_punct=True, exceptions=exceptions)
+    assert result == "FOO-x $5 ab"
+
+
+def test_exception_patterns_overlap():
+    # the match starting first wins, regardless of the order of the patterns
+    text = "ab-cd"
+    assert cleantext.clean(text, no_punct=True, exceptions=[r"cd", r"ab-c"]) == "ab-cd"
+
+
+def test_exception_later_pattern_matches_placeholder():
+    text = "aa-bb cc"
+    result = cleantext.clean(text, no_punct=True, exceptions=[r"(a)\1", r"\w+-bb"])
+    assert result == "aa-bb cc"
+
+
+def test_exception_placeholders_never_contain_delimiter():
+    from cleantext.clean import _encode_index
+
+    assert [_encode_index(i) for i in (0, 24, 25, 26, 650)] == ["a", "y", "aa", "ab", "aaa"]
+    assert not any("z" in _encode_index(i) for i in range(5000))
+
+
+# ---------------------------------------------------------------------------
+# Cleaner tests
+# ---------------------------------------------------------------------------
+
+
+cleaner_configs = [
+    {},
+    {"no_urls": True, "no_emails": True, "no_phone_numbers": True, "no_numbers": True, "no_punct": True},
+    {"lang": "de", "lower": False, "no_currency_symbols": True},
+    {"to_ascii": False, "no_emoji": True, "no_line_breaks": True},
+    {"no_punct": True, "replace_with_punct": " ", "exceptions": [r"\w+-\w+"]},
+]
+
+cleaner_texts = [
+    "Visit https://example.com or mail me@example.com, costs $5!",
+    "Äpfel, Birnen und Grüße aus München 🎉",
+    "drive-thru\n\nand   pick-up 😊",
+    None,
+    42,
+]
+
+
+def test_cleaner_matches_clean():
+    for config in cleaner_configs:
+        cleaner = cleantext.Cleaner(**config)
+        for text in cleaner_texts:
+            assert cleaner(text) == cleantext.clean(text, **config)
+
+
+def test_cleaner_map():
+    cleaner = cleantext.Cleaner(no_urls=True)
+    assert cleaner.map(cleaner_texts) == [cleantext.clean(t, no_urls=True) for t in cleaner_texts]
+    assert cleaner.map(iter(["a  b"])) == ["a b"]
+
+
+def test_cleaner_only_enabled_stages():
+    assert cleantext.Cleaner().stage_names == ["fix_unicode", "to_ascii", "lower", "normalize_whitespace"]
+    cleaner = cleantext.Cleaner(fix_unicode=False, to_ascii=False, lower=False, normalize_whitespace=False)
+    assert cleaner.stage_names == []
+    assert cleaner(" Keep Me ") == " Keep Me "
+    assert "no_emoji" in cleantext.Cleaner(to_ascii=False, no_emoji=True).stage_names
+    assert "no_emoji" not in cleantext.Cleaner(no_emoji=True).stage_names
+
+
+def test_cleaner_pickle():
+    import pickle
+
+    cleaner = cleantext.Cleaner(no_urls=True, lang="de", exceptions=[r"\w+-\w+"])
+    restored = pickle.loads(pickle.dumps(cleaner))
+    assert restored == cleaner
+    assert restored.config == cleaner.config
+    assert restored("drive-thru to http://x.com") == cleaner("drive-thru to http://x.com")
+
+
+def test_cleaner_equality():
+    assert cleantext.Cleaner(no_urls=True) == cleantext.Cleaner(no_urls=True)
+    assert cleantext.Cleaner(no_urls=True) != cleantext.Cleaner()
+    assert hash(cleantext.Cleaner(exceptions=["a"])) == hash(cleantext.Cleaner(exceptions=("a",)))
+
+
+def test_cleaner_validates_config():
+    import re
+
+    with pytest.raises(re.error):
+        cleantext.Cleaner(exceptions=["(unclosed"])
+    with pytest.raises(TypeError):
+        cleantext.Cleaner(no_urls=True, replace_with_url=None)
+    with pytest.raises(TypeError):
+        cleantext.Cleaner(lang=None)
+    with pytest.raises(TypeError):
+        cleantext.Cleaner(no_punct=True, replace_with_punct=1)
+    # arguments of disabled steps are not used and thus not checked
+    cleantext.Cleaner(replace_with_url=None)
+    assert cleantext.Cleaner(lang=None, to_ascii=False)("Grüße") == "grüße"
+    # None is what some steps accepted before
+    cleantext.Cleaner(no_currency_symbols=True, replace_with_currency_symbol=None)
+    assert cleantext.Cleaner(no_punct=True, replace_with_punct=None)("Hi, you!") == "hi you"
+
+
+# ---------------------------------------------------------------------------
+# punctuation table tests
+# ---------------------------------------------------------------------------
+
+
+def test_punct_table_built_lazily():
+    import subprocess
+    import sys
+
+    code = (
+        "import cleantext, cleantext.constants as c; "
+        "assert cleantext.remove_punct('ä, b!') == 'ä b'; "
+        "assert cleantext.remove_punct('a, b!') == 'a b'; "
+        "assert 'PUNCT_TRANSLATE_UNICODE' in vars(c)"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_punct_codepoints_disk_cache(tmp_path, monkeypatch):
+    import unicodedata
+
+    from cleantext import constants
+
+    monkeypatch.setenv(constants.CACHE_DIR_ENV, str(tmp_path / "cache"))
+    constants.punct_codepoints.cache_clear()
+    try:
+        scanned = constants.punct_codepoints()
+        cache_file = tmp_path / "cache" / f"punct-{unicodedata.unidata_version}.json"
+        assert cache_file.exists()
+
+        # a second cold start loads the file instead of scanning again
+        constants.punct_codepoints.cache_clear()
+        monkeypatch.setattr(constants, "_scan_punct_codepoints", lambda: pytest.fail("should not rescan"))
+        assert constants.punct_codepoints() == scanned
+        assert ord(",") in scanned
+        assert ord("a") not in scanned
+    finally:
+        constants.punct_codepoints.cache_clear()
+
+
+def test_punct_codepoints_corrupt_cache(tmp_path, monkeypatch):
+    import unicodedata
+
+    from cleantext import constants
+
+    (tmp_path / f"punct-{unicodedata.unidata_version}.json").write_text("not json")
+    monkeypatch.setenv(constants.CACHE_DIR_ENV, str(tmp_path))
+    constants.punct_codepoints.cache_clear()
+    try:
+        assert ord("!") in constants.punct_codepoints()
+    finally:
+        constants.punct_codepoints.cache_clear()
+
+
+def test_replace_punct_table_cached():
+    from cleantext import constants
+
+    assert constants.punct_translate_table(" ") is constants.punct_translate_table(" ")
+    assert constants.punct_translate_table("") is constants.PUNCT_TRANSLATE_UNICODE
+    assert cleantext.replace_punct("a,b!c", "_") == "a_b_c"
+    assert cleantext.replace_punct("a,b!c", "") == cleantext.remove_punct("a,b!c")
+
+
+def test_remove_punct_ascii():
+    from cleantext import constants
+
+    text = "I can't -- won't! (x, y); \"z\"?"
+    # the ASCII table deletes via None, the general one via ""
+    assert cleantext.remove_punct(text) == text.translate(constants.PUNCT_TRANSLATE_UNICODE) == "I cant  wont x y z"
+
+
+# ---------------------------------------------------------------------------
+# CleaningPool tests
+# ---------------------------------------------------------------------------
+
+
+pool_texts = ["Visit http://example.com today", "Äpfel und Birnen", None, "Price is $100", "a-b and c-d"] * 5
+
+
+def test_cleaning_pool_map():
+    with cleantext.CleaningPool(n_jobs=2, no_urls=True) as pool:
+        assert pool.map(pool_texts) == [cleantext.clean(t, no_urls=True) for t in pool_texts]
+        # the same workers serve many batches
+        assert pool.map(pool_texts[:3], chunksize=1) == [cleantext.clean(t, no_urls=True) for t in pool_texts[:3]]
+        assert pool.map([]) == []
+
+
+def test_cleaning_pool_sequential():
+    with cleantext.CleaningPool(n_jobs=1, lang="de") as pool:
+        assert pool._pool is None
+        assert pool.map(pool_texts) == [cleantext.clean(t, lang="de") for t in pool_texts]
+
+
+def test_cleaning_pool_from_cleaner():
+    cleaner = cleantext.Cleaner(no_punct=True, exceptions=[r"\w+-\w+"])
+    with cleantext.CleaningPool(n_jobs=2, cleaner=cleaner) as pool:
+        assert pool.cleaner is cleaner
+        assert pool.map(pool_texts) == cleaner.map(pool_texts)
+    with pytest.raises(TypeError):
+        cleantext.CleaningPool(n_jobs=1, cleaner=cleaner, no_urls=True)
+
+
+def test_cleaning_pool_closed():
+    pool = cleantext.CleaningPool(n_jobs=2)
+    pool.close()
+    with pytest.raises(ValueError):
+        pool.map(["hello"])
+
+
+def test_cleaning_pool_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    expected = [cleantext.clean(t) for t in pool_texts]
+    with cleantext.CleaningPool(n_jobs=2) as pool, ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(lambda _: pool.map(pool_texts), range(8)))
+    assert all(r == expected for r in results)
+
+
+def test_clean_texts_with_pool():
+    with cleantext.CleaningPool(n_jobs=2, no_urls=True) as pool:
+        expected = [cleantext.clean(t, no_urls=True) for t in pool_texts]
+        # options default to the configuration of the pool
+        assert cleantext.clean_texts(pool_texts, pool=pool) == expected
+        assert cleantext.clean_texts(pool_texts, pool=pool, no_urls=True) == expected
+        with pytest.raises(ValueError):
+            cleantext.clean_texts(pool_texts, pool=pool, no_emails=True)
+
+
+def test_cleaning_pool_shared_memory():
+    import os
+
+    texts = pool_texts + ["", "\ud83d lone surrogate", "Grüße 🎉" * 100, 42]
+    expected = [cleantext.clean(t, no_urls=True) for t in texts]
+    segments = set(os.listdir("/dev/shm")) if os.path.isdir("/dev/shm") else set()
+    with cleantext.CleaningPool(n_jobs=2, no_urls=True) as pool:
+        assert pool.map(texts, transport="shared_memory") == expected
+        assert pool.map(texts, chunksize=3, transport="shared_memory") == expected
+        assert pool.map(["", ""], transport="shared_memory") == ["", ""]
+        assert cleantext.clean_texts(texts, pool=pool, transport="shared_memory") == expected
+        with pytest.raises(ValueError):
+            pool.map(texts, transport="pipe")
+    assert cleantext.clean_texts(texts, n_jobs=2, transport="shared_memory", no_urls=True) == expected
+    # all segments were unlinked
+    if os.path.isdir("/dev/shm"):
+        assert set(os.listdir("/dev/shm")) <= segments
+    with pytest.raises(ValueError):
+        cleantext.clean_texts(texts, n_jobs=2, executor="thread", transport="shared_memory")
+
+
+def test_cleaning_pool_shared_memory_no_leaked_segments():
+    import subprocess
+    import sys
+
+    code = (
+        "import cleantext\n"
+        "if __name__ == '__main__':\n"
+        "    with cleantext.CleaningPool(n_jobs=2) as pool:\n"
+        "        for _ in range(3):\n"
+        "            assert pool.map(['Hi there!'] * 50, transport='shared_memory') == ['hi there!'] * 50\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    # the resource tracker warns about segments it still had registered at shutdown
+    assert "resource_tracker" not in result.stderr
+
+
+def test_cleaning_pool_shared_memory_only_on_posix(monkeypatch):
+    import types
+
+    from cleantext import parallel
+
+    with cleantext.CleaningPool(n_jobs=2, no_urls=True) as pool:
+        monkeypatch.setattr(parallel, "os", types.SimpleNamespace(name="nt"))
+        monkeypatch.setattr(pool, "_map_shared", None)
+        assert pool.map(pool_texts, transport="shared_memory") == [
+            cleantext.clean(t, no_urls=True) for t in pool_texts
+        ]
+
+
+# ---------------------------------------------------------------------------
+# iter_clean_texts tests
+# ---------------------------------------------------------------------------
+
+
+def test_iter_clean_texts_sequential():
+    result = cleantext.iter_clean_texts(t for t in pool_texts)
+    assert not isinstance(result, list)
+    assert list(result) == [cleantext.clean(t) for t in pool_texts]
+
+
+def test_iter_clean_texts_parallel_order():
+    texts = [f"Text {i}  with http://example.com/{i}" for i in range(500)]
+    result = cleantext.iter_clean_texts(iter(texts), n_jobs=2, chunksize=7, max_in_flight=3, no_urls=True)
+    assert list(result) == [cleantext.clean(t, no_urls=True) for t in texts]
+
+
+def test_iter_clean_texts_lazy_input():
+    consumed = []
+
+    def texts():
+        for i in range(10_000):
+            consumed.append(i)
+            yield f"text {i}"
+
+    result = cleantext.iter_clean_texts(texts(), n_jobs=2, chunksize=10, max_in_flight=2)
+    assert next(result) == "text 0"
+    # only the chunks inside the in-flight window were read from the input
+    assert len(consumed) <= 30
+    result.close()
+
+
+def test_iter_clean_texts_with_pool():
+    with cleantext.CleaningPool(n_jobs=2, lang="de") as pool:
+        result = list(cleantext.iter_clean_texts(pool_texts, pool=pool, chunksize=3))
+        assert result == [cleantext.clean(t, lang="de") for t in pool_texts]
+        with pytest.raises(ValueError):
+            list(cleantext.iter_clean_texts(pool_texts, pool=pool, no_urls=True))
+
+
+def test_iter_clean_texts_invalid_chunksize():
+    with pytest.raises(ValueError):
+        list(cleantext.iter_clean_texts(["a"], chunksize=0))
+
+
+def test_balanced_chunks():
+    from cleantext.parallel import _balanced_chunks
+
+    texts = ["a" * 1000, "b", None, "c" * 10, "d" * 500, "e" * 500, "f"]
+    chunks = _balanced_chunks(texts, 4)
+    assert sorted(i for chunk in chunks for i in chunk) == list(range(len(texts)))
+    # the longest text is dispatched first and alone
+    assert chunks[0] == [0]
+    assert chunks[1] == [4, 5]
+    assert _balanced_chunks([], 4) == []
+    assert _balanced_chunks(["", ""], 4) == [[0, 1]]
+
+
+def test_clean_texts_skewed_lengths_order_preserved():
+    texts = ["Short  TEXT"] * 50 + ["Long " * 5000] + ["tiny"] * 50 + ["Medium " * 200, None]
+    result = cleantext.clean_texts(texts, n_jobs=2)
+    assert result == [cleantext.clean(t) for t in texts]
+
+
+# ---------------------------------------------------------------------------
+# fused entity replacement tests
+# ---------------------------------------------------------------------------
+
+
+entity_flags = {
+    "no_urls": True,
+    "no_emails": True,
+    "no_phone_numbers": True,
+    "no_ip_addresses": True,
+    "no_file_paths": True,
+    "no_numbers": True,
+    "no_code": True,
+}
+
+entity_texts = [
+    "Visit https://example.com/page?id=42 or mail me@example.com, call 555-123-4567.",
+    "Server 8.8.8.8 and fe80::1 serve /usr/local/bin and ./src for 3 users",
+    "Inline `code` and ```py\nx = 1\n``` then C:\\Users\\me costs 1,299.99",
+    "no entities at all here",
+    "",
+]
+
+
+def test_fuse_entities_matches_sequential():
+    for extra in [{}, {"to_ascii": False}, {"lower": False, "no_digits": True}]:
+        sequential = cleantext.Cleaner(**entity_flags, **extra)
+        fused = cleantext.Cleaner(**entity_flags, **extra, fuse_entities=True)
+        for text in entity_texts:
+            assert fused(text) == sequential(text)
+
+
+def test_fuse_entities_stages():
+    names = cleantext.Cleaner(**entity_flags, fuse_entities=True).stage_names
+    # to_ascii runs between code and the other entities, so code stays separate
+    assert names == ["fix_unicode", "no_code", "to_ascii", "entities", "lower", "normalize_whitespace"]
+    names = cleantext.Cleaner(**entity_flags, to_ascii=False, fuse_entities=True).stage_names
+    assert names == ["fix_unicode", "entities", "lower", "normalize_whitespace"]
+    # a single entity step is left alone
+    assert "entities" not in cleantext.Cleaner(no_urls=True, fuse_entities=True).stage_names
+
+
+def test_fuse_entities_precedence():
+    tokens = {"no_urls": "<URL>", "no_emails": "<EMAIL>", "no_ip_addresses": "<IP>", "no_numbers": "<NUMBER>"}
+    steps = tuple(tokens)
+    # matches starting at the same position go to the earlier step, as step by step
+    assert cleantext.replace_entities("dns 8.8.8.8", steps, tokens) == "dns <IP>"
+    assert cleantext.clean("dns 8.8.8.8", no_ip_addresses=True, no_numbers=True) == "dns <ip>"
+    # overlapping matches go to the one starting first, unlike step by step
+    assert cleantext.replace_entities("user@www.example.com", steps, tokens) == "<EMAIL>"
+    assert cleantext.replace_emails(cleantext.replace_urls("user@www.example.com")) == "user@<URL>"
+
+
+def test_fuse_entities_tokens_literal():
+    tokens = {"no_urls": "\\1", "no_numbers": "#"}
+    assert cleantext.replace_entities("see www.x.com 7 times", ("no_urls", "no_numbers"), tokens) == "see \\1 # times"
+
+
+# ---------------------------------------------------------------------------
+# precheck tests
+# ---------------------------------------------------------------------------
+
+
+def test_prechecks_skip_stages():
+    cleaner = cleantext.Cleaner(**entity_flags, no_digits=True, no_currency_symbols=True)
+    assert cleaner("just words") == "just words"
+    assert cleaner.calls == 1
+    for name in entity_flags:
+        assert cleaner.skipped[name] == 1
+    assert cleaner.skipped["no_digits"] == 1
+
+    cleaner.reset_stats()
+    assert cleaner("mail me@example.com") == "mail <email>"
+    assert cleaner.skipped["no_emails"] == 0
+    assert cleaner.skipped["no_urls"] == 1
+    assert cleaner.skipped["no_numbers"] == 1
+
+
+def test_prechecks_do_not_change_results():
+    texts = entity_texts + [
+        "mustermann(at)fh-aachen.de and m[AT]x.de",
+        "WWW.EXAMPLE.COM and FTP://x.org",
+        "costs 5zł or ₹10 or $3",
+        "v6 only: :: and fe80::",
+        "٣٤٥٦٧٨٩ arabic-indic digits",
+    ]
+    config = dict(entity_flags, no_digits=True, no_currency_symbols=True, to_ascii=False)
+    cleaner = cleantext.Cleaner(**config)
+    for text in texts:
+        expected = text
+        for _, step, _ in cleaner._stages:
+            expected = step(expected)
+        assert cleaner(text) == expected
+
+
+def test_prechecks_fused():
+    cleaner = cleantext.Cleaner(**entity_flags, fuse_entities=True)
+    assert cleaner("nothing to see") == "nothing to see"
+    assert cleaner.skipped["entities"] == 1
+    assert cleaner("see www.example.com") == "see <url>"
+    assert cleaner.skipped["entities"] == 1
+
+
+# ---------------------------------------------------------------------------
+# ASCII fast path tests
+# ---------------------------------------------------------------------------
+
+
+ascii_pieces = [
+    "Hello",
+    " ",
+    "\n",
+    "\t",
+    "`",
+    ":smile:",
+    "xxxxxaexxxxx",
+    "&amp;",
+    "\\u00e9",
+    "\r\n",
+    "\x1b[31m",
+    "$5",
+    "www.example.com",
+    "a@b.de",
+    "555-123-4567",
+    "\x7f",
+]
+
+
+def test_ascii_fast_path_matches_full_path():
+    import random
+
+    rng = random.Random(0)
+    texts = ["".join(rng.choice(ascii_pieces) for _ in range(rng.randint(1, 8))) for _ in range(2000)]
+    configs = [
+        {},
+        {"lang": "de"},
+        {"lang": "sv", "no_emoji": True},
+        {"to_ascii": False, "no_emoji": True},
+        {"fix_unicode": False, "lower": False},
+        dict(entity_flags, no_currency_symbols=True, no_punct=True),
+        # non-ASCII replacement tokens, which `no_emoji` must still see
+        dict(entity_flags, to_ascii=False, no_emoji=True, replace_with_url="🔗", replace_with_email="✉️"),
+        dict(entity_flags, no_emoji=True, replace_with_phone_number="☎", replace_with_number="№"),
+        {"to_ascii": False, "no_emoji": True, "no_punct": True, "replace_with_punct": "✨"},
+    ]
+    for config in configs:
+        cleaner = cleantext.Cleaner(**config)
+        assert cleaner._ascii_stages is not None
+        for text in texts:
+            assert cleaner(text) == cleaner._apply(text, cleaner._stages)
+    cleaned = cleantext.clean("see http://x.com", to_ascii=False, no_emoji=True, no_urls=True, replace_with_url="🔗")
+    assert cleaned == "see"
+
+
+def test_ascii_fast_path_skips_stages():
+    names = [name for name, _, _ in cleantext.Cleaner(to_ascii=False, no_emoji=True)._ascii_stages]
+    assert names == ["no_emoji", "lower", "normalize_whitespace"]
+    # a non-ASCII replacement before `to_ascii` would be transliterated, so there is no shortcut
+    assert cleantext.Cleaner(no_currency_symbols=True, replace_with_currency_symbol="é")._ascii_stages is None
+    assert cleantext.clean("costs $5", no_currency_symbols=True, replace_with_currency_symbol="é") == "costs e5"
+
+
+# ---------------------------------------------------------------------------
+# language-specific transliteration tests
+# ---------------------------------------------------------------------------
+
+
+def test_to_ascii_keeps_special_characters():
+    assert cleantext.to_ascii_unicode("Grüße aus Köln, Èze", lang="de") == "Grüße aus Köln, Eze"
+    # characters sharing a transliteration are still kept apart
+    assert cleantext.to_ascii_unicode("è ê ë é", lang="fr") == "è ê ë é"
+    assert cleantext.to_ascii_unicode("ä ö ø Ä Ö", lang="sv") == "ä ö ø Ä Ö"
+    # other languages' special characters are transliterated
+    assert cleantext.to_ascii_unicode("Köln", lang="es") == "Koln"
+
+
+def test_to_ascii_special_characters_decomposed():
+    # "a" followed by a combining diaeresis is normalized to "ä" before matching
+    assert cleantext.to_ascii_unicode("Bär", lang="de") == "Bär"
+
+
+def test_to_ascii_no_escape_sequence_collisions():
+    assert cleantext.to_ascii_unicode("xxxxxaexxxxx", lang="de") == "xxxxxaexxxxx"
+    assert cleantext.clean("xxxxxaexxxxx", lang="de") == "xxxxxaexxxxx"
+
+
+def test_specials_regex_cached():
+    from cleantext.specials import specials_regex
+
+    assert specials_regex("de") is specials_regex("de")
+    assert specials_regex("de").findall("Mäßig ça") == ["ç"]
+    assert specials_regex("en").findall("Mäßig") == ["äß"]
+
+
+def test_save_replace_deprecated():
+    from cleantext import specials
+
+    with pytest.deprecated_call():
+        escaped = specials.save_replace("Grüße", "de")
+    assert escaped == "Grxxxxxuexxxxxxxxxxssxxxxxe"
+    with pytest.deprecated_call():
+        assert specials.save_replace(escaped, "de", back=True) == "Grüße"
+    with pytest.deprecated_call():
+        assert specials.escape_sequence == "xxxxx"
+    with pytest.raises(AttributeError):
+        specials.missing
+
+
+# ---------------------------------------------------------------------------
+# emoji scanner tests
+# ---------------------------------------------------------------------------
+
+
+def test_to_ascii_keeps_emoji_unchanged():
+    text = "Bär 🇸🇹 🪲 👩🏻‍💼 ©"
+    assert cleantext.to_ascii_unicode(text) == "Bar 🇸🇹 🪲 👩🏻‍💼 ©"
+    assert cleantext.to_ascii_unicode(text, lang="de") == "Bär 🇸🇹 🪲 👩🏻‍💼 ©"
+    assert cleantext.to_ascii_unicode("Bär 🇸🇹 🪲", no_emoji=True).rstrip() == "Bar"
+
+
+def test_to_ascii_leaves_shortcodes_alone():
+    assert cleantext.to_ascii_unicode("hi :smile:") == "hi :smile:"
+    assert cleantext.clean("über :thumbs_up:") == "uber :thumbs_up:"
+
+
+def test_remove_emoji_matches_emoji_library():
+    import emoji
+
+    for e in emoji.EMOJI_DATA:
+        text = f"a{e}b {e}{e}1#"
+        assert cleantext.remove_emoji(text) == emoji.replace_emoji(text, replace="")
+
+
+def test_remove_emoji_drops_stray_selectors_and_joiners():
+    # sequences that are not in the emoji list still lose their joiners and selectors
+    assert cleantext.remove_emoji("Nice 👍️ work") == "Nice  work"
+    assert cleantext.remove_emoji("a 😀\u200d b") == "a  b"
+    assert cleantext.remove_emoji("👍\u200d😀\u200d🎉") == ""
+    assert cleantext.remove_emoji("x\ufe0f y\ufe0e") == "x y"
+    assert cleantext.clean("Nice 👍️ work", to_ascii=False, no_emoji=True) == "nice work"
+
+
+def test_remove_emoji_leaves_no_invisible_residue():
+    import random
+
+    import emoji
+
+    rng = random.Random(11)
+    emojis = [e for e in emoji.EMOJI_DATA if len(e) == 1]
+    pieces = ["a", "b", " ", "\ufe0f", "\ufe0e", "\u200d", "\U0001f3fb"]
+    for _ in range(2000):
+        text = "".join(rng.choice(emojis) if rng.random() < 0.4 else rng.choice(pieces) for _ in range(12))
+        result = cleantext.remove_emoji(text)
+        assert not set(result) & {"\ufe0e", "\ufe0f"}
+        assert emoji.emoji_count(result) == 0
+        assert [c for c in result if c in "ab "] == [c for c in text if c in "ab "]
+        # baseline behaviour for everything except zero-width joiners
+        assert result.replace("\u200d", "") == emoji.replace_emoji(text, replace="").replace("\u200d", "")
+
+
+def test_emoji_regex_cached():
+    from cleantext.constants import emoji_regex
+
+    assert emoji_regex() is emoji_regex()
+    assert emoji_regex().findall("a 👨‍👩‍👧 b 1️⃣ 1") == ["👨‍👩‍👧", "1️⃣"]
+
+
+def test_no_emoji_skipped_for_ascii():
+    cleaner = cleantext.Cleaner(no_emoji=True, to_ascii=False, lower=False)
+    # "&" may be an HTML entity for ftfy, so the ASCII shortcut is not taken
+    assert cleaner("no emoji & here") == "no emoji & here"
+    assert cleaner.skipped["no_emoji"] == 1
+    assert cleaner("emoji 🎉 here") == "emoji here"
+
+
+# ---------------------------------------------------------------------------
+# ResultCache tests
+# ---------------------------------------------------------------------------
+
+
+def test_result_cache_clean():
+    cache = cleantext.ResultCache()
+    text = "RT @user: Check https://example.com  NOW"
+    expected = cleantext.clean(text, no_urls=True)
+    assert cleantext.clean(text, no_urls=True, cache=cache) == expected
+    assert cleantext.clean(text, no_urls=True, cache=cache) == expected
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+    # a different configuration is a different entry
+    assert cleantext.clean(text, cache=cache) == cleantext.clean(text)
+    assert (cache.hits, cache.misses, len(cache)) == (1, 2, 2)
+
+
+def test_result_cache_clean_texts():
+    cache = cleantext.ResultCache()
+    texts = ["Hello  World", "RT same", None, "RT same", "Hello  World", "other"]
+    expected = cleantext.clean_texts(texts, lower=False)
+    assert cleantext.clean_texts(texts, lower=False, cache=cache) == expected
+    assert (cache.hits, cache.misses, cache.skipped, len(cache)) == (0, 5, 1, 3)
+    assert cleantext.clean_texts(texts, lower=False, cache=cache) == expected
+    assert cache.hits == 5
+
+
+def test_result_cache_cleans_each_missing_text_once():
+    cache = cleantext.ResultCache()
+    cleaner = cleantext.Cleaner()
+    seen = []
+
+    def clean_many(texts):
+        seen.extend(texts)
+        return cleaner.map(texts)
+
+    assert cache.map(cleaner, ["a", "b", "a", "a"], clean_many) == ["a", "b", "a", "a"]
+    assert seen == ["a", "b"]
+
+
+def test_result_cache_clean_texts_parallel():
+    cache = cleantext.ResultCache()
+    texts = ["Hello  World", "RT same", "RT same", "other"] * 10
+    expected = cleantext.clean_texts(texts)
+    assert cleantext.clean_texts(texts, n_jobs=2, cache=cache) == expected
+    assert len(cache) == 3
+    with cleantext.CleaningPool(n_jobs=2, no_urls=True) as pool:
+        assert cleantext.clean_texts(texts, pool=pool, cache=cache) == cleantext.clean_texts(texts, no_urls=True)
+    assert len(cache) == 6
+
+
+def test_result_cache_evicts_least_recently_used():
+    cache = cleantext.ResultCache(maxsize=2)
+    cleantext.clean("a", cache=cache)
+    cleantext.clean("b", cache=cache)
+    cleantext.clean("a", cache=cache)
+    cleantext.clean("c", cache=cache)
+    assert (len(cache), cache.evictions) == (2, 1)
+    cleantext.clean("a", cache=cache)
+    assert cache.hits == 2
+
+
+def test_result_cache_max_bytes():
+    import sys
+
+    size = sys.getsizeof("x" * 100) * 2
+    cache = cleantext.ResultCache(max_bytes=size * 3, max_text_length=None)
+    for i in range(10):
+        cleantext.clean(str(i) * 100, lower=False, cache=cache)
+    assert len(cache) == 3
+    assert cache.nbytes <= size * 3
+    assert cache.evictions == 7
+
+
+def test_result_cache_max_text_length():
+    cache = cleantext.ResultCache(max_text_length=5)
+    assert cleantext.clean("a long text", cache=cache) == "a long text"
+    assert cleantext.clean("short", cache=cache) == "short"
+    assert (cache.skipped, cache.misses, len(cache)) == (1, 1, 1)
+    cache.clear()
+    cache.reset_stats()
+    assert (len(cache), cache.nbytes, cache.misses) == (0, 0, 0)
+
+
+def test_result_cache_validates_bounds():
+    with pytest.raises(ValueError):
+        cleantext.ResultCache(maxsize=-1)
+    with pytest.raises(ValueError):
+        cleantext.ResultCache(max_bytes=1.5)
+
+
+# ---------------------------------------------------------------------------
+# dedupe tests
+# ---------------------------------------------------------------------------
+
+
+def test_clean_texts_dedupe():
+    texts = ["Hello  World", "RT same", None, "RT same", 1, True, "Hello  World", "1"]
+    assert cleantext.clean_texts(texts, dedupe=True) == cleantext.clean_texts(texts)
+    assert cleantext.clean_texts([], dedupe=True) == []
+
+
+def test_clean_texts_dedupe_cleans_each_text_once(monkeypatch):
+    cleaned = []
+    original_map = cleantext.Cleaner.map
+
+    def map(self, texts, profiler=None):
+        cleaned.extend(texts)
+        return original_map(self, texts, profiler)
+
+    monkeypatch.setattr(cleantext.Cleaner, "map", map)
+    assert cleantext.clean_texts(["a", "b", "a", "a"], dedupe=True) == ["a", "b", "a", "a"]
+    assert cleaned == ["a", "b"]
+
+
+def test_clean_texts_dedupe_logs_ratio(caplog):
+    import logging
+
+    with caplog.at_level(logging.INFO):
+        cleantext.clean_texts(["a", "a", "a", "b"], dedupe=True)
+    assert "2 of 4 texts are duplicates (50.0%)" in caplog.text
+
+
+def test_clean_texts_dedupe_parallel():
+    texts = ["Hello  World", "RT same", "RT same", "other"] * 25
+    assert cleantext.clean_texts(texts, n_jobs=2, dedupe=True) == cleantext.clean_texts(texts)
+    cache = cleantext.ResultCache()
+    assert cleantext.clean_texts(texts, dedupe=True, cache=cache) == cleantext.clean_texts(texts)
+    assert (cache.hits, cache.misses) == (0, 3)
+
+
+# ---------------------------------------------------------------------------
+# executor tests
+# ---------------------------------------------------------------------------
+
+
+thread_texts = [
+    "Visit https://example.com or mail me@example.com, call 555-123-4567!",
+    "Grüße aus München — «quotes» and emoji 🎉👍🏽 café",
+    "drive-thru costs $5 at 192.168.0.1 ~/docs/file.txt",
+    "```\ncode\n``` and `inline` 1,000.50 €",
+    "plain ascii text",
+] * 40
+
+
+def test_clean_texts_thread_executor():
+    options = dict(no_urls=True, no_emails=True, no_currency_symbols=True, lang="de")
+    expected = cleantext.clean_texts(thread_texts, **options)
+    assert cleantext.clean_texts(thread_texts, n_jobs=4, executor="thread", **options) == expected
+
+
+def test_clean_texts_threads_build_lazy_state_safely():
+    """Several threads building the lazily compiled tables and regexes at once get the same results."""
+    from cleantext import constants, specials
+    from cleantext.clean import _entity_scanner, _get_cleaner
+
+    options = [
+        dict(no_punct=True, replace_with_punct="_", no_emoji=True, to_ascii=False),
+        dict(no_punct=True, lang="sv", exceptions=[r"\w+-\w+"]),
+        dict(no_urls=True, no_emails=True, no_phone_numbers=True, no_ip_addresses=True, fuse_entities=True),
+    ]
+    expected = [cleantext.clean_texts(thread_texts, **o) for o in options]
+    for func in (
+        constants.punct_codepoints,
+        constants.punct_translate_table,
+        constants.emoji_regex,
+        constants.emoji_removal_regex,
+        specials.specials_regex,
+        _get_cleaner,
+        _entity_scanner,
+    ):
+        func.cache_clear()
+    for o, e in zip(options, expected):
+        assert cleantext.clean_texts(thread_texts, n_jobs=8, executor="thread", **o) == e
+
+
+def test_clean_texts_invalid_executor():
+    with pytest.raises(ValueError):
+        cleantext.clean_texts(["a"], executor="fiber")
+
+
+@pytest.mark.skipif(
+    not hasattr(__import__("concurrent.futures").futures, "InterpreterPoolExecutor"),
+    reason="needs concurrent.futures.InterpreterPoolExecutor",
+)
+def test_clean_texts_interpreter_executor():
+    assert cleantext.clean_texts(thread_texts, n_jobs=2, executor="interpreter") == cleantext.clean_texts(thread_texts)
+
+
+def test_clean_texts_interpreter_executor_unavailable():
+    import concurrent.futures
+
+    if hasattr(concurrent.futures, "InterpreterPoolExecutor"):
+        pytest.skip("InterpreterPoolExecutor is available")
+    with pytest.raises(ValueError):
+        cleantext.clean_texts(thread_texts, n_jobs=2, executor="interpreter")
+
+
+# ---------------------------------------------------------------------------
+# Profiler tests
+# ---------------------------------------------------------------------------
+
+
+def test_profiler_clean():
+    profiler = cleantext.Profiler()
+    text = "Visit https://example.com  NOW"
+    assert cleantext.clean(text, no_urls=True, profiler=profiler) == cleantext.clean(text, no_urls=True)
+    stats = profiler.stats()
+    assert stats["total"]["calls"] == 1
+    assert stats["no_urls"]["calls"] == 1
+    assert (stats["total"]["chars_in"], stats["total"]["chars_out"]) == (len(text), len("visit <url> now"))
+    assert stats["no_urls"]["chars_in"] > stats["no_urls"]["chars_out"]
+    for s in stats.values():
+        assert 0 <= s["p50"] <= s["p90"] <= s["p99"] <= s["max"] <= s["total"]
+    assert sum(s["total"] for name, s in stats.items() if name != "total") <= stats["total"]["total"]
+
+
+def test_profiler_skipped_steps_are_not_recorded():
+    profiler = cleantext.Profiler()
+    cleantext.clean_texts(["no links here"] * 3, no_urls=True, profiler=profiler)
+    stats = profiler.stats()
+    assert stats["total"]["calls"] == 3
+    assert "no_urls" not in stats
+
+
+def test_profiler_exceptions():
+    profiler = cleantext.Profiler()
+    cleantext.clean("drive-thru and more", no_punct=True, exceptions=[r"\w+-\w+"], profiler=profiler)
+    stats = profiler.stats()
+    assert stats["protect_exceptions"]["calls"] == stats["restore_exceptions"]["calls"] == 1
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(n_jobs=2),
+        dict(n_jobs=2, chunksize=5),
+        dict(n_jobs=2, transport="shared_memory"),
+        dict(n_jobs=2, executor="thread"),
+        dict(dedupe=True),
+    ],
+)
+def test_profiler_clean_texts_merges_workers(kwargs):
+    options = dict(no_urls=True, no_emails=True, no_currency_symbols=True)
+    sequential = cleantext.Profiler()
+    expected = cleantext.clean_texts(thread_texts, profiler=sequential, **options)
+    chunksize = kwargs.pop("chunksize", None)
+    profiler = cleantext.Profiler()
+    if chunksize is None:
+        assert cleantext.clean_texts(thread_texts, profiler=profiler, **options, **kwargs) == expected
+    else:
+        with cleantext.CleaningPool(**options, **kwargs) as pool:
+            assert pool.map(thread_texts, chunksize=chunksize, profiler=profiler) == expected
+    calls = {name: s["calls"] for name, s in profiler.stats().items()}
+    if "dedupe" in kwargs:
+        assert calls["total"] == len(set(thread_texts))
+    else:
+        assert calls == {name: s["calls"] for name, s in sequential.stats().items()}
+
+
+def test_profiler_cache_hits_are_not_recorded():
+    cache = cleantext.ResultCache()
+    profiler = cleantext.Profiler(slowest=5)
+    cleantext.clean_texts(["a  b", "a  b", "c"], cache=cache, profiler=profiler)
+    cleantext.clean_texts(["a  b", "c"], cache=cache, profiler=profiler)
+    assert profiler.stats()["total"]["calls"] == 2
+    assert sorted(record["index"] for record in profiler.slowest_texts()) == [0, 2]
+
+
+def test_profiler_merge_pickle_and_reset():
+    import pickle
+
+    first = cleantext.Profiler()
+    second = cleantext.Profiler()
+    cleantext.clean_texts(["a", "b"], profiler=first)
+    cleantext.clean_texts(["c"], no_urls=True, profiler=second)
+    first.merge(pickle.loads(pickle.dumps(second)))
+    assert first.stats()["total"]["calls"] == 3
+    report = first.report()
+    assert report.splitlines()[1].startswith("total")
+    assert len(report.splitlines()) == len(first.stats()) + 1
+    first.reset()
+    assert first.stats() == {}
+
+
+def test_profiler_percentiles():
+    from cleantext.profiler import _StageStats
+
+    stats = _StageStats()
+    for _ in range(98):
+        stats.add(1e-5, 1, 1)
+    stats.add(1e-3, 1, 1)
+    stats.add(1e-1, 1, 1)
+    assert stats.percentile(50) == pytest.approx(1e-5, rel=0.1)
+    assert stats.percentile(99) == pytest.approx(1e-3, rel=0.1)
+    assert stats.percentile(100) == pytest.approx(1e-1, rel=0.1)
+    assert stats.max == 1e-1
+
+
+slow_texts = ["short", "a bit longer text", "x " * 50_000 + " https://example.com", "mid " * 50] * 3
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(),
+        dict(n_jobs=2),
+        dict(n_jobs=2, transport="shared_memory"),
+        dict(n_jobs=2, executor="thread"),
+        dict(dedupe=True),
+        dict(cache="cache"),
+    ],
+)
+def test_profiler_slowest_texts(kwargs):
+    if "cache" in kwargs:
+        kwargs["cache"] = cleantext.ResultCache()
+    profiler = cleantext.Profiler(slowest=2, sample_length=10)
+    cleantext.clean_texts(slow_texts, no_urls=True, profiler=profiler, **kwargs)
+    slowest = profiler.slowest_texts()
+    assert len(slowest) == 2
+    assert slowest[0]["total"] >= slowest[1]["total"]
+    for record in slowest:
+        text = slow_texts[record["index"]]
+        assert (record["length"], record["sample"]) == (len(text), text[:10])
+        assert sum(record["stages"].values()) <= record["total"]
+    # the longest text by far, deduplicated texts are reported at their first position. Another text
+    # may be slower if its process was preempted, but not both
+    assert {record["index"] for record in slowest} & {2, 6, 10}
+    if "dedupe" in kwargs:
+        assert all(record["index"] < 4 for record in slowest)
+
+
+def test_profiler_slowest_texts_merge_and_reset():
+    profiler = cleantext.Profiler(slowest=3)
+    assert profiler.slowest_texts() == []
+    cleantext.clean("x" * 1000, profiler=profiler)
+    assert profiler.slowest_texts()[0]["index"] is None
+    chunk_profiler = cleantext.Profiler(slowest=3)
+    cleantext.Cleaner().map(["a", "b" * 1000], chunk_profiler)
+    profiler.merge(chunk_profiler, [7, 8])
+    assert sorted(record["index"] for record in profiler.slowest_texts() if record["index"] is not None) == [7, 8]
+    profiler.reset()
+    assert profiler.slowest_texts() == []
+    assert cleantext.Profiler().slowest_texts() == []
+    with pytest.raises(ValueError):
+        cleantext.Profiler(slowest=-1)
+
+
+# ---------------------------------------------------------------------------
+# backtracking tests
+# ---------------------------------------------------------------------------
+
+# the regexes before their unbounded parts were capped, to check that they match the same
+old_regexes = {
+    "EMAIL_REGEX": (
+        r"(?:^|(?<=[^\w@.)]))([\w+-](\.(?!\.))?)*?[\w+-](@|[(<{\[]at[)>}\]])(?:(?:[a-z\\u00a1-\\uffff0-9]-?)*"
+        r"[a-z\\u00a1-\\uffff0-9]+)(?:\.(?:[a-z\\u00a1-\\uffff0-9]-?)*[a-z\\u00a1-\\uffff0-9]+)*"
+        r"(?:\.(?:[a-z\\u00a1-\\uffff]{2,}))"
+    ),
+    "URL_REGEX": (
+        r"(?:^|(?<![\w\/\.]))(?:(?:https?:\/\/|ftp:\/\/|www\d{0,3}\.))(?:\S+(?::\S*)?@)?(?:"
+        r"(?!(?:10|127)(?:\.\d{1,3}){3})(?!(?:169\.254|192\.168)(?:\.\d{1,3}){2})"
+        r"(?!172\.(?:1[6-9]|2\d|3[0-1])(?:\.\d{1,3}){2})(?:[1-9]\d?|1\d\d|2[01]\d|22[0-3])"
+        r"(?:\.(?:1?\d{1,2}|2[0-4]\d|25[0-5])){2}(?:\.(?:[1-9]\d?|1\d\d|2[0-4]\d|25[0-4]))|"
+        r"(?:(?:[a-z\\u00a1-\\uffff0-9]-?)*[a-z\\u00a1-\\uffff0-9]+)"
+        r"(?:\.(?:[a-z\\u00a1-\\uffff0-9]-?)*[a-z\\u00a1-\\uffff0-9]+)*(?:\.(?:[a-z\\u00a1-\\uffff]{2,}))|"
+        r"(?:(localhost)))(?::\d{2,5})?(?:\/[^\)\]\}\s]*)?"
+    ),
+    "CODE_REGEX": r"(?P<fence>`{3,})\w*\n[\s\S]*?(?P=fence)|`[^`\n]+`",
+}
+
+regex_tokens = [
+    "http://", "https://", "www.", "ftp://", "a", "b1", "-", ".", "..", "@", "(at)", "[at]", ":", "/", " ", "com",
+    "de", "192.168.0.1", "8.8.8.8", "localhost", ")", "8080", "x.de", "`", "```", "````", "\n", "py", "+", "_", "ü",
+]  # fmt: skip
+
+
+@pytest.mark.parametrize("name", sorted(old_regexes))
+def test_capped_regexes_match_like_before(name):
+    import random
+    import re
+
+    from cleantext import constants
+
+    regex = getattr(constants, name)
+    old = re.compile(old_regexes[name], regex.flags)
+    rng = random.Random(0)
+    texts = ["".join(rng.choices(regex_tokens, k=rng.randint(1, 20))) for _ in range(5000)]
+    texts += email_addresses + not_email_addresses + thread_texts[:5]
+    for text in texts:
+        assert regex.sub("X", text) == old.sub("X", text), text
+
+
+@pytest.mark.parametrize(
+    "name, text, expected",
+    [
+        # at the caps, long inputs are matched as before
+        ("EMAIL_REGEX", "x" * 64 + "@b.com", "X"),
+        ("EMAIL_REGEX", "x@" + "a" * 63 + ".com", "X"),
+        ("URL_REGEX", "http://" + "a" * 256 + "@x.com", "X"),
+        ("CODE_REGEX", "`" * 64 + "py\ncode\n" + "`" * 64, "X"),
+        # beyond them, they were matched as a whole before
+        ("EMAIL_REGEX", "x" * 70 + "@b.com", "x" * 70 + "@b.com"),
+        # an email can start after a `-` or `+` of a too long local part
+        ("EMAIL_REGEX", "x" * 40 + "-" + "y" * 30 + "@b.com", "x" * 40 + "-X"),
+        ("EMAIL_REGEX", "x@" + "a" * 70 + ".com", "x@" + "a" * 70 + ".com"),
+        # a too long label ends the host name if the label before it can be a TLD
+        ("EMAIL_REGEX", "x@foo." + "a" * 70 + ".com", "X.com"),
+        ("URL_REGEX", "http://www.foo." + "a" * 70 + ".com/x", "X.com/x"),
+        ("URL_REGEX", "http://" + "a" * 300 + "@x.com", "http://" + "a" * 300 + "@x.com"),
+        # no TLD within the first 253 characters of the host name
+        ("URL_REGEX", "http://" + "a-b." * 70 + "com", "http://" + "a-b." * 70 + "com"),
+        ("CODE_REGEX", "`" * 70 + "py\ncode\n" + "`" * 70, "`" * 6 + "X" + "`" * 6),
+    ],
+)
+def test_capped_regexes_on_long_inputs(name, text, expected):
+    import re
+
+    from cleantext import constants
+
+    regex = getattr(constants, name)
+    assert regex.sub("X", text) == expected
+    # the regexes before the caps replaced all of these as a whole
+    assert re.compile(old_regexes[name], regex.flags).sub("X", text) == "X"
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "a-" * 10_000,  # many starts of emails without @
+        "a@" * 10_000,
+        "x@" + "a" * 20_000,  # host without TLD
+        "-www.a" * 3_000,
+        ("-www.a" * 40 + "--.cc ") * 300,  # TLD after an invalid label
+        "http://" + "a:" * 10_000,
+        "`" * 20_000,
+        "```\n" + "a" * 20_000,  # unterminated fence
+    ],
+    ids=[
+        "hyphens",
+        "at-signs",
+        "host-without-tld",
+        "www-hyphens",
+        "www-hyphens-tld",
+        "colons",
+        "backticks",
+        "unterminated-fence",
+    ],
+)
+def test_regexes_run_in_linear_time(text):
+    import time
+
+    start = time.perf_counter()
+    cleantext.clean(text, no_urls=True, no_emails=True, no_code=True)
+    # the uncapped regexes took minutes for some of these
+    assert time.perf_counter() - start < 5
@@ -32,5 +32,83 @@ try:
     def test_fit():
         transformer.fit(["sample1", "sample2"], [0, 1])
         transformer.partial_fit(["sample1", "sample2"])
+
+    def test_series_keeps_index_and_name():
+        X = pd.Series(["Hello  World", None, "Ünïcode"], index=[7, 3, 5], name="text", dtype=object)
+        result = CleanTransformer(lower=False).transform(X)
+        assert result.index.tolist() == [7, 3, 5]
+        assert result.name == "text"
+        assert result.tolist() == ["Hello World", "", "Unicode"]
+
+    def test_empty_series():
+        X = pd.Series([], dtype=object, name="text")
+        result = CleanTransformer().transform(X)
+        assert result.empty
+        assert result.name == "text"
+
+    def test_transform_matches_clean():
+        from cleantext import clean
+
+        texts = ["Visit https://example.com NOW", "drive-thru & 555-123-4567", "Grüße 👋"]
+        params = dict(no_urls=True, no_phone_numbers=True, no_punct=True, lang="de", exceptions=[r"\w+-\w+"])
+        expected = [clean(text, **params) for text in texts]
+        assert CleanTransformer(**params).transform(texts) == expected
+        assert CleanTransformer(**params).transform(pd.Series(texts)).tolist() == expected
+
+    def test_params_resolved_once(monkeypatch):
+        ct = CleanTransformer()
+        calls = []
+        get_params = ct.get_params
+        monkeypatch.setattr(ct, "get_params", lambda deep=True: calls.append(1) or get_params(deep))
+        ct.transform(pd.Series(["a"] * 100))
+        assert len(calls) == 1
+
+    def test_parallel_transform_series():
+        texts = [f"Text  {i} with https://example.com/{i}" * (i % 7 + 1) for i in range(200)]
+        X = pd.Series(texts, index=range(1000, 800, -1), name="text")
+        expected = CleanTransformer(no_urls=True).transform(X)
+        result = CleanTransformer(no_urls=True, n_jobs=2).transform(X)
+        pd.testing.assert_series_equal(result, expected)
+        assert CleanTransformer(no_urls=True, n_jobs=-1).transform(texts) == expected.tolist()
+
+    def test_parallel_transform_nested_in_grid_search():
+        from sklearn.feature_extraction.text import CountVectorizer
+        from sklearn.linear_model import LogisticRegression
+        from sklearn.model_selection import GridSearchCV
+        from sklearn.pipeline import make_pipeline
+
+        X = ["good stuff", "bad stuff", "good https://x.com", "bad thing"] * 5
+        y = [1, 0, 1, 0] * 5
+        pipeline = make_pipeline(CleanTransformer(n_jobs=2), CountVectorizer(), LogisticRegression())
+        search = GridSearchCV(pipeline, {"cleantransformer__no_urls": [False, True]}, cv=2, n_jobs=2)
+        search.fit(X, y)
+        assert search.best_score_ == 1.0
+
+    def test_parallel_transform_follows_parallel_config(monkeypatch):
+        from joblib import parallel_config
+
+        import cleantext.sklearn
+
+        calls = []
+        parallel = cleantext.sklearn.Parallel
+
+        def recording_parallel(n_jobs):
+            calls.append(n_jobs)
+            return parallel(n_jobs=n_jobs)
+
+        monkeypatch.setattr(cleantext.sklearn, "Parallel", recording_parallel)
+        texts = [f"Text {i} https://example.com/{i}" for i in range(50)]
+        expected = CleanTransformer(no_urls=True).transform(texts)
+        assert calls == []
+        with parallel_config(backend="threading", n_jobs=2):
+            assert CleanTransformer(no_urls=True).transform(texts) == expected
+            # an explicit n_jobs wins
+            assert CleanTransformer(no_urls=True, n_jobs=3).transform(texts) == expected
+            assert CleanTransformer(no_urls=True, n_jobs=1).transform(texts) == expected
+        assert calls == [None, 3]
+
+    def test_invalid_n_jobs():
+        with pytest.raises(ValueError):
+            CleanTransformer(n_jobs=0).transform(["a"])
 except ImportError:
     pass
@@ -0,0 +1,136 @@
+import gzip
+import json
+import subprocess
+import sys
+
+import pytest
+
+from cleantext import clean
+from cleantext.cli import main
+
+texts = [
+    "Visit https://example.com NOW!",
+    "Grüße aus   München",
+    "",
+    'He said "hi", then left',
+]
+
+
+def test_lines(tmp_path, capsys):
+    path = tmp_path / "in.txt"
+    path.write_text("\n".join(texts) + "\n", encoding="utf-8")
+    assert main([str(path), "--no-urls", "-q"]) == 0
+    out, err = capsys.readouterr()
+    assert out.splitlines() == [clean(text, no_urls=True) for text in texts]
+    assert err == ""
+
+
+def test_lines_one_line_per_record(tmp_path, capsys):
+    # clean turns these into "\n", depending on the options
+    lines = ["a\x0bb", "c\x0cd", "e\x85f", "g\u2028h", "i\u2029j"]
+    path = tmp_path / "in.txt"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    for options in ([], ["--no-fix-unicode"], ["--no-fix-unicode", "--no-normalize-whitespace"]):
+        assert main([str(path), "-q", *options]) == 0
+        out, _ = capsys.readouterr()
+        assert len(out.splitlines()) == len(lines)
+
+
+def test_lines_gzip_in_batches(tmp_path):
+    path = tmp_path / "in.txt.gz"
+    out_path = tmp_path / "out.txt.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.write("\n".join(texts * 10) + "\n")
+    assert main([str(path), "-o", str(out_path), "--batch-size", "3", "--no-lower", "-q"]) == 0
+    with gzip.open(out_path, "rt", encoding="utf-8") as f:
+        assert f.read().splitlines() == [clean(text, lower=False) for text in texts * 10]
+
+
+def test_lines_parallel(tmp_path):
+    path = tmp_path / "in.txt"
+    out_path = tmp_path / "out.txt"
+    path.write_text("\n".join(texts * 25) + "\n", encoding="utf-8")
+    assert main([str(path), "-o", str(out_path), "-j", "2", "--batch-size", "40", "-q"]) == 0
+    assert out_path.read_text(encoding="utf-8").splitlines() == [clean(text) for text in texts * 25]
+
+
+def test_jsonl_fields(tmp_path, capsys):
+    records = [
+        {"id": 1, "text": "Hello  World", "user": {"bio": "Ünïcode FAN"}},
+        {"id": 2, "text": None, "user": {}},
+        {"id": 3},
+    ]
+    path = tmp_path / "in.jsonl"
+    path.write_text("\n".join(json.dumps(r) for r in records) + "\n", encoding="utf-8")
+    assert main([str(path), "--field", "text", "--field", "user.bio", "--no-to-ascii", "-q"]) == 0
+    out, _ = capsys.readouterr()
+    assert [json.loads(line) for line in out.splitlines()] == [
+        {"id": 1, "text": "hello world", "user": {"bio": "ünïcode fan"}},
+        {"id": 2, "text": None, "user": {}},
+        {"id": 3},
+    ]
+
+
+def test_csv_columns(tmp_path, capsys):
+    path = tmp_path / "in.csv"
+    path.write_text('id,comment,note\n1,"Multi\nLine  TEXT",KEEP\n2,short\n', encoding="utf-8")
+    assert main([str(path), "--column", "comment", "--no-line-breaks", "-q"]) == 0
+    out, _ = capsys.readouterr()
+    assert out == "id,comment,note\n1,multi line text,KEEP\n2,short\n"
+
+
+def test_csv_unknown_column(tmp_path, capsys):
+    path = tmp_path / "in.csv"
+    path.write_text("id,comment\n1,a\n", encoding="utf-8")
+    assert main([str(path), "--column", "missing"]) == 1
+    out, err = capsys.readouterr()
+    assert "Unknown columns: missing" in err
+    # nothing is written, not even the header
+    assert out == ""
+    out_path = tmp_path / "out.csv"
+    assert main([str(path), "-o", str(out_path), "--column", "missing"]) == 1
+    assert not out_path.exists()
+
+
+def test_exceptions_and_tokens(tmp_path, capsys):
+    path = tmp_path / "in.txt"
+    path.write_text("drive-thru at https://example.com\n", encoding="utf-8")
+    args = [
+        str(path),
+        "--no-punct",
+        "--no-urls",
+        "--replace-with-url",
+        "URL",
+        "--no-lower",
+        "--exception",
+        r"\w+-\w+",
+        "-q",
+    ]
+    assert main(args) == 0
+    assert capsys.readouterr().out == "drive-thru at URL\n"
+
+
+def test_throughput_on_stderr(tmp_path, capsys):
+    path = tmp_path / "in.txt"
+    path.write_text("a\nb\n", encoding="utf-8")
+    assert main([str(path)]) == 0
+    assert "cleaned 2 texts" in capsys.readouterr().err
+
+
+def test_invalid_arguments(tmp_path, capsys):
+    path = tmp_path / "in.txt"
+    path.write_text("a\n", encoding="utf-8")
+    assert main([str(path), "-j", "0"]) == 1
+    assert main([str(tmp_path / "missing.txt")]) == 1
+    with pytest.raises(SystemExit):
+        main(["--format", "xml"])
+
+
+def test_module_entry_point():
+    result = subprocess.run(
+        [sys.executable, "-m", "cleantext", "--no-lower", "-q"],
+        input=b"Hello   World\n",
+        capture_output=True,
+        check=True,
+    )
+    assert result.stdout.decode() == "Hello World\n"